@@ -4,17 +4,55 @@ ReconMaster Diff Detector
 Detects changes between reconnaissance scans
 """
 
+import io
 import os
+import re
+import sys
 import json
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set
+
+try:
+    from pyroaring import BitMap
+    _HAVE_ROARING = True
+except ImportError:
+    _HAVE_ROARING = False
+
+try:
+    import orjson
+    _HAVE_ORJSON = True
+except ImportError:
+    _HAVE_ORJSON = False
+
+# Open TCP port lines in nmap normal output, e.g. "80/tcp  open  http"
+PORT_RE = re.compile(rb'^(\d+)/tcp\s+open\b', re.MULTILINE)
+
+# Host part of a line holding either "sub.example.com" or "https://sub.example.com/path"
+HOST_LINE_RE = re.compile(rb'^[ \t]*(?:[^\s/]*://)?([^/\s]+)', re.MULTILINE)
+
+
+def dumps_json(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available"""
+    if _HAVE_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
 
 
 class DiffDetector:
     """Detects and reports changes between scans"""
     
+    # Sidecar file memoizing parsed artifacts per scan directory
+    CACHE_FILE = ".diff_cache.json"
+    
+    # Above this size on both sides, diff via the (usually small) intersection
+    TWO_PHASE_THRESHOLD = 50_000
+    
     def __init__(self):
         self.changes = []
+        self._caches: Dict[str, Dict] = {}
+        self._dirty_caches: Set[str] = set()
     
     def detect_changes(self, previous_scan: str, current_scan: str, monitoring_config: Dict) -> List[Dict]:
         """
@@ -48,15 +86,19 @@ class DiffDetector:
         if monitoring_config.get("detect_new_vulnerabilities", True):
             self._check_vulnerabilities(previous, current)
         
+        self._flush_caches(previous, current)
         return self.changes
     
     def _check_subdomains(self, previous: Path, current: Path):
         """Check for new or removed subdomains"""
         prev_subs = self._load_subdomains(previous)
         curr_subs = self._load_subdomains(current)
+        if not prev_subs and not curr_subs:
+            return
+        
+        new_subs, removed_subs = self._set_delta(prev_subs, curr_subs)
         
         # New subdomains
-        new_subs = curr_subs - prev_subs
         if new_subs:
             self.changes.append({
                 "type": "new_subdomains",
@@ -66,7 +108,6 @@ class DiffDetector:
             })
         
         # Removed subdomains
-        removed_subs = prev_subs - curr_subs
         if removed_subs:
             self.changes.append({
                 "type": "removed_subdomains",
@@ -79,9 +120,12 @@ class DiffDetector:
         """Check for new subdomain takeover vulnerabilities"""
         prev_takeovers = self._load_takeovers(previous)
         curr_takeovers = self._load_takeovers(current)
+        if not prev_takeovers and not curr_takeovers:
+            return
+        
+        new_takeovers, resolved_takeovers = self._set_delta(prev_takeovers, curr_takeovers)
         
         # New takeover vulnerabilities
-        new_takeovers = curr_takeovers - prev_takeovers
         if new_takeovers:
             self.changes.append({
                 "type": "new_takeover_vulnerability",
@@ -91,7 +135,6 @@ class DiffDetector:
             })
         
         # Resolved takeovers
-        resolved_takeovers = prev_takeovers - curr_takeovers
         if resolved_takeovers:
             self.changes.append({
                 "type": "resolved_takeover",
@@ -105,15 +148,14 @@ class DiffDetector:
         prev_ports = self._load_port_summary(previous)
         curr_ports = self._load_port_summary(current)
         
-        for host in curr_ports:
-            if host not in prev_ports:
+        for host, curr_list in curr_ports.items():
+            prev_list = prev_ports.get(host)
+            if not prev_list or not curr_list:
                 continue
             
-            prev_open = set(prev_ports[host])
-            curr_open = set(curr_ports[host])
+            new_ports, closed_ports = self._diff_ports(prev_list, curr_list)
             
             # New open ports
-            new_ports = curr_open - prev_open
             if new_ports:
                 self.changes.append({
                     "type": "new_open_ports",
@@ -126,7 +168,6 @@ class DiffDetector:
                 })
             
             # Closed ports
-            closed_ports = prev_open - curr_open
             if closed_ports:
                 self.changes.append({
                     "type": "closed_ports",
@@ -138,6 +179,51 @@ class DiffDetector:
                     }
                 })
     
+    @classmethod
+    def _set_delta(cls, prev: Set[str], curr: Set[str]):
+        """Return (added, removed) between two scans' sets"""
+        # Skip the hash build when one side is empty
+        if not prev:
+            return curr, set()
+        if not curr:
+            return set(), prev
+        
+        if min(len(prev), len(curr)) > cls.TWO_PHASE_THRESHOLD:
+            return cls._two_phase_difference(prev, curr)
+        
+        # One symmetric difference instead of two directional ones
+        changed = curr ^ prev
+        if not changed:
+            return set(), set()
+        added = changed & curr
+        return added, changed - added
+    
+    @staticmethod
+    def _two_phase_difference(prev: Set[str], curr: Set[str]):
+        """Return (curr - prev, prev - curr) via their intersection built from the smaller side"""
+        small, big = (prev, curr) if len(prev) < len(curr) else (curr, prev)
+        common = {x for x in small if x in big}
+        return curr - common, prev - common
+    
+    @staticmethod
+    def _diff_ports(prev_list: List[int], curr_list: List[int]):
+        """Return (new, closed) ports, hashing only the smaller side"""
+        if _HAVE_ROARING:
+            # Ports are 16-bit ints: compressed bitmaps diff with a few ANDNOT ops
+            prev_bm, curr_bm = BitMap(prev_list), BitMap(curr_list)
+            return curr_bm - prev_bm, prev_bm - curr_bm
+        
+        prev_is_small = len(prev_list) <= len(curr_list)
+        small, large = (prev_list, curr_list) if prev_is_small else (curr_list, prev_list)
+        
+        small_set = set(small)
+        large_only = {p for p in large if p not in small_set}
+        small_only = small_set.difference(large)
+        
+        if prev_is_small:
+            return large_only, small_only
+        return small_only, large_only
+    
     def _check_ssl(self, previous: Path, current: Path):
         """Check for SSL certificate changes"""
         # This would parse nmap output for SSL cert changes
@@ -146,22 +232,24 @@ class DiffDetector:
     
     def _load_subdomains(self, scan_dir: Path) -> Set[str]:
         """Load subdomains from scan directory"""
+        paths = [
+            scan_dir / "subdomains" / "live_subdomains.txt",
+            scan_dir / "subdomains" / "all_passive.txt",
+        ]
+        return self._load_cached(scan_dir, "subdomains", paths, self._parse_subdomains)
+    
+    def _parse_subdomains(self, scan_dir: Path) -> Set[str]:
+        """Parse subdomain lists from scan directory"""
         subdomains = set()
         
         # Try to load from live_subdomains.txt (Titan Standard)
         live_file = scan_dir / "subdomains" / "live_subdomains.txt"
         if live_file.exists():
             try:
-                with open(live_file, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line:
-                            # Extract domain if it's a URL
-                            if "://" in line:
-                                domain = line.split("://")[1].split("/")[0]
-                            else:
-                                domain = line
-                            subdomains.add(domain)
+                with open(live_file, 'rb') as f:
+                    data = f.read()
+                # Extract the host whether the line is a bare domain or a URL
+                subdomains.update(sys.intern(h.decode('utf-8', 'ignore')) for h in HOST_LINE_RE.findall(data))
             except Exception as e:
                 print(f"[!] Error loading subdomains: {e}")
         
@@ -169,11 +257,8 @@ class DiffDetector:
         passive_file = scan_dir / "subdomains" / "all_passive.txt"
         if passive_file.exists():
             try:
-                with open(passive_file, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line:
-                            subdomains.add(line)
+                with open(passive_file, 'rb') as f:
+                    subdomains.update(map(sys.intern, f.read().decode('utf-8', 'ignore').split()))
             except Exception:
                 pass
         
@@ -181,6 +266,11 @@ class DiffDetector:
     
     def _load_takeovers(self, scan_dir: Path) -> Set[str]:
         """Load takeover vulnerabilities from scan directory"""
+        paths = [scan_dir / "subdomains" / "takeovers.txt"]
+        return self._load_cached(scan_dir, "takeovers", paths, self._parse_takeovers)
+    
+    def _parse_takeovers(self, scan_dir: Path) -> Set[str]:
+        """Parse takeover findings from scan directory"""
         takeovers = set()
         
         takeover_file = scan_dir / "subdomains" / "takeovers.txt"
@@ -198,78 +288,154 @@ class DiffDetector:
     
     def _load_port_summary(self, scan_dir: Path) -> Dict[str, List[int]]:
         """Load port scan summary"""
+        nmap_dir = scan_dir / "nmap"
+        paths = sorted(nmap_dir.glob("*.txt")) if nmap_dir.exists() else []
+        return self._load_cached(scan_dir, "ports", paths, self._parse_port_summary)
+    
+    def _parse_port_summary(self, scan_dir: Path) -> Dict[str, List[int]]:
+        """Parse nmap output files into a port summary"""
         port_summary = {}
         
         nmap_dir = scan_dir / "nmap"
         if not nmap_dir.exists():
             return port_summary
         
-        # Parse nmap output files (Titan Standard)
-        for nmap_file in nmap_dir.glob("*.txt"):
-            try:
-                host = nmap_file.stem
-                open_ports = []
-                
-                with open(nmap_file, 'r') as f:
-                    for line in f:
-                        # Look for lines like "80/tcp  open  http"
-                        if "/tcp" in line and "open" in line:
-                            try:
-                                port = int(line.split("/")[0].strip())
-                                open_ports.append(port)
-                            except:
-                                continue
-                
+        # Parse nmap output files (Titan Standard); files are independent, so read them concurrently
+        files = list(nmap_dir.glob("*.txt"))
+        if not files:
+            return port_summary
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(files))) as executor:
+            for host, open_ports in executor.map(self._parse_one_nmap, files):
                 if open_ports:
                     port_summary[host] = open_ports
-                    
-            except Exception as e:
-                print(f"[!] Error parsing {nmap_file}: {e}")
         
         return port_summary
     
+    @staticmethod
+    def _parse_one_nmap(nmap_file: Path):
+        """Return (host, open_ports) for a single nmap output file"""
+        host = nmap_file.stem
+        try:
+            with open(nmap_file, 'rb') as f:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        return host, [int(p) for p in PORT_RE.findall(mm)]
+                except ValueError:
+                    # mmap cannot map empty files
+                    return host, [int(p) for p in PORT_RE.findall(f.read())]
+        except Exception as e:
+            print(f"[!] Error parsing {nmap_file}: {e}")
+            return host, []
+    
+    def _load_cached(self, scan_dir: Path, key: str, paths: List[Path], loader: Callable[[Path], Any]) -> Any:
+        """
+        Return parsed scan artifacts, reusing the sidecar cache when unchanged
+        
+        Args:
+            scan_dir: Scan directory owning the artifacts
+            key: Cache entry name
+            paths: Source files the parsed result depends on
+            loader: Parser invoked on a cache miss
+            
+        Returns:
+            The parsed set or dict
+        """
+        fingerprint = []
+        for path in paths:
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            fingerprint.append([str(path.relative_to(scan_dir)), st.st_mtime_ns, st.st_size])
+        
+        cache = self._get_cache(scan_dir)
+        entry = cache.get(key)
+        if isinstance(entry, dict) and entry.get("fingerprint") == fingerprint:
+            data = entry.get("data")
+            # Intern hostnames so names repeated across scans share one object
+            return set(map(sys.intern, data)) if entry.get("kind") == "set" else data
+        
+        result = loader(scan_dir)
+        is_set = isinstance(result, set)
+        cache[key] = {
+            "fingerprint": fingerprint,
+            "kind": "set" if is_set else "dict",
+            "data": sorted(result) if is_set else result
+        }
+        self._dirty_caches.add(str(scan_dir))
+        return result
+    
+    def _get_cache(self, scan_dir: Path) -> Dict:
+        """Get the in-memory cache for a scan directory, loading the sidecar once"""
+        key = str(scan_dir)
+        if key not in self._caches:
+            cache = self._load_json(scan_dir / self.CACHE_FILE)
+            self._caches[key] = cache if isinstance(cache, dict) else {}
+        return self._caches[key]
+    
+    def _flush_caches(self, *keep: Path):
+        """Atomically persist modified caches and drop those no longer in use"""
+        for key in self._dirty_caches:
+            cache_file = Path(key) / self.CACHE_FILE
+            tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+            try:
+                fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(dumps_json(self._caches[key]))
+                os.replace(tmp_file, cache_file)
+            except OSError as e:
+                print(f"[!] Error writing diff cache {cache_file}: {e}")
+        self._dirty_caches.clear()
+        
+        # The current scan becomes the next "previous" scan, so keep it warm
+        keep_keys = {str(p) for p in keep}
+        self._caches = {k: v for k, v in self._caches.items() if k in keep_keys}
+    
     def generate_diff_report(self, output_file: str):
         """Generate a detailed diff report"""
         if not self.changes:
             return
         
+        # Group by severity in a single pass
+        buckets = {"critical": [], "high": [], "medium": [], "low": []}
+        for change in self.changes:
+            bucket = buckets.get(change.get("severity"))
+            if bucket is not None:
+                bucket.append(change)
+        
+        buf = io.StringIO()
+        buf.write("# Reconnaissance Scan Changes Report\n\n")
+        buf.write(f"**Total Changes Detected:** {len(self.changes)}\n\n")
+        
+        if buckets["critical"]:
+            buf.write("## 🚨 Critical Changes\n\n")
+            for change in buckets["critical"]:
+                buf.write(f"- **{change['description']}**\n")
+                if change.get("details"):
+                    buf.write(f"  - Details: {change['details']}\n")
+            buf.write("\n")
+        
+        if buckets["high"]:
+            buf.write("## ⚠️ High Priority Changes\n\n")
+            for change in buckets["high"]:
+                buf.write(f"- {change['description']}\n")
+                if change.get("details"):
+                    buf.write(f"  - Details: {change['details']}\n")
+            buf.write("\n")
+        
+        if buckets["medium"]:
+            buf.write("## 📊 Medium Priority Changes\n\n")
+            buf.writelines(f"- {c['description']}\n" for c in buckets["medium"])
+            buf.write("\n")
+        
+        if buckets["low"]:
+            buf.write("## ℹ️ Low Priority Changes\n\n")
+            buf.writelines(f"- {c['description']}\n" for c in buckets["low"])
+            buf.write("\n")
+        
         with open(output_file, 'w') as f:
-            f.write("# Reconnaissance Scan Changes Report\n\n")
-            f.write(f"**Total Changes Detected:** {len(self.changes)}\n\n")
-            
-            # Group by severity
-            critical = [c for c in self.changes if c.get("severity") == "critical"]
-            high = [c for c in self.changes if c.get("severity") == "high"]
-            medium = [c for c in self.changes if c.get("severity") == "medium"]
-            low = [c for c in self.changes if c.get("severity") == "low"]
-            
-            if critical:
-                f.write("## 🚨 Critical Changes\n\n")
-                for change in critical:
-                    f.write(f"- **{change['description']}**\n")
-                    if change.get("details"):
-                        f.write(f"  - Details: {change['details']}\n")
-                f.write("\n")
-            
-            if high:
-                f.write("## ⚠️ High Priority Changes\n\n")
-                for change in high:
-                    f.write(f"- {change['description']}\n")
-                    if change.get("details"):
-                        f.write(f"  - Details: {change['details']}\n")
-                f.write("\n")
-            
-            if medium:
-                f.write("## 📊 Medium Priority Changes\n\n")
-                for change in medium:
-                    f.write(f"- {change['description']}\n")
-                f.write("\n")
-            
-            if low:
-                f.write("## ℹ️ Low Priority Changes\n\n")
-                for change in low:
-                    f.write(f"- {change['description']}\n")
-                f.write("\n")
+            f.write(buf.getvalue())
 
     def _check_vulnerabilities(self, previous: Path, current: Path):
         """Check for new critical/high vulnerabilities using summary.json"""
@@ -8,11 +8,16 @@ Author: VIPHACKER100
 
 import os
 import sys
+import copy
 import json
 import yaml
 import time
+import signal
+import hashlib
 import schedule
+import threading
 import subprocess
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -47,13 +52,23 @@ def print_monitoring_banner():
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from monitor.diff_detector import DiffDetector
+from monitor.diff_detector import DiffDetector, dumps_json
 from monitor.alerting import AlertManager
 
 
+# Prefer the libyaml C parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 class ReconScheduler:
     """Manages scheduled reconnaissance scans"""
     
+    # Parsed configs keyed by path, invalidated on (mtime_ns, size) change; callers get deep copies
+    _config_cache: Dict[str, tuple] = {}
+    
+    # Per-target file holding the path of the newest processed scan
+    LATEST_POINTER = "latest.txt"
+    
     def __init__(self, config_path: str = "config/monitoring_config.yaml"):
         self.config_path = config_path
         self.config = self.load_config()
@@ -72,8 +87,16 @@ class ReconScheduler:
             return self.get_default_config()
         
         try:
+            st = config_file.stat()
+            key = str(config_file.resolve())
+            cached = self._config_cache.get(key)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return copy.deepcopy(cached[2])
+            
             with open(config_file, 'r') as f:
-                return yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YAML_LOADER)
+            self._config_cache[key] = (st.st_mtime_ns, st.st_size, copy.deepcopy(config))
+            return config
         except Exception as e:
             print(f"[!] Error loading config: {e}")
             return self.get_default_config()
@@ -135,22 +158,48 @@ class ReconScheduler:
             cmd.append("--passive-only")
         
         try:
-            # Run the scan
-            result = subprocess.run(
+            # Run the scan, keeping only the tail of stderr instead of buffering all output
+            # Own process group, so a timeout can take down the tools the scan spawned as well
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 encoding='utf-8',
-                timeout=3600  # 1 hour timeout
+                errors='replace',
+                start_new_session=sys.platform != "win32"
             )
+            stderr_tail = deque(maxlen=200)
+            reader = threading.Thread(target=stderr_tail.extend, args=(proc.stderr,), daemon=True)
+            reader.start()
             
-            if result.returncode == 0:
+            try:
+                returncode = proc.wait(timeout=3600)  # 1 hour timeout
+            except BaseException:
+                # Timeout, Ctrl-C or anything else: the scan's own session no longer sees our SIGINT
+                try:
+                    if sys.platform == "win32":
+                        subprocess.run(["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+                                       capture_output=True, check=False)
+                    else:
+                        os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                proc.wait()
+                raise
+            finally:
+                # A stray grandchild can still hold the pipe open; don't let it block the scheduler
+                reader.join(timeout=10)
+                if not reader.is_alive():
+                    proc.stderr.close()
+            
+            if returncode == 0:
                 print(f"[+] Scan completed successfully")
                 print(f"[+] Results saved to: {output_dir}")
                 return str(output_dir)
             else:
-                print(f"[!] Scan failed with exit code {result.returncode}")
-                print(f"[!] Error: {result.stderr}")
+                print(f"[!] Scan failed with exit code {returncode}")
+                print(f"[!] Error: {''.join(stderr_tail)}")
                 return None
                 
         except subprocess.TimeoutExpired:
@@ -169,7 +218,16 @@ class ReconScheduler:
         
         if not previous_scan:
             print("[*] No previous scan found - this is the baseline")
-            self.save_scan_metadata(target, scan_dir, is_baseline=True)
+            self.save_scan_metadata(target, scan_dir, is_baseline=True, fingerprint=self._scan_fingerprint(scan_dir))
+            return
+        
+        # Skip the diff entirely when the monitored outputs are byte-identical
+        fingerprint = self._scan_fingerprint(scan_dir)
+        prev_metadata = self._load_scan_metadata(previous_scan)
+        if prev_metadata.get("fingerprint") == fingerprint:
+            print("[+] Scan outputs unchanged since previous scan - skipping diff")
+            self.save_scan_metadata(target, scan_dir, fingerprint=fingerprint)
+            self.update_dashboard_data()
             return
         
         # Detect changes
@@ -186,7 +244,7 @@ class ReconScheduler:
             print("[+] No significant changes detected")
         
         # Save metadata
-        self.save_scan_metadata(target, scan_dir, changes=changes)
+        self.save_scan_metadata(target, scan_dir, changes=changes, fingerprint=fingerprint)
         
         # Update aggregate dashboard data
         self.update_dashboard_data()
@@ -236,31 +294,79 @@ class ReconScheduler:
         if not target_dir.exists():
             return None
         
-        # Get all scan directories except current
-        scan_dirs = [
-            d for d in target_dir.iterdir()
-            if d.is_dir() and str(d) != current_scan
-        ]
+        # Fast path: pointer written by save_scan_metadata
+        try:
+            latest = (target_dir / self.LATEST_POINTER).read_text(encoding='utf-8').strip()
+            if latest and latest != current_scan and os.path.isdir(latest):
+                return latest
+        except OSError:
+            pass
         
-        if not scan_dirs:
-            return None
+        # Most recent scan directory except current (names are timestamps)
+        latest = max(
+            (d for d in target_dir.iterdir() if d.is_dir() and str(d) != current_scan),
+            key=lambda d: d.name,
+            default=None
+        )
+        return str(latest) if latest else None
+    
+    def _scan_fingerprint(self, scan_dir: str) -> str:
+        """Hash the contents of the outputs DiffDetector compares"""
+        root = Path(scan_dir)
+        digest = hashlib.blake2b(digest_size=16)
         
-        # Return most recent
-        return str(sorted(scan_dirs)[-1])
+        files = sorted(root.glob("subdomains/*.txt")) + sorted(root.glob("nmap/*.txt"))
+        for path in files:
+            digest.update(path.relative_to(root).as_posix().encode() + b"\0")
+            try:
+                with open(path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b""):
+                        digest.update(chunk)
+            except OSError:
+                continue
+            digest.update(b"\0")
+        
+        # Only the findings counts of summary.json matter; its timestamps always differ
+        summary = self._load_json_file(root / "summary.json")
+        digest.update(json.dumps(summary.get("findings", {}), sort_keys=True).encode())
+        return digest.hexdigest()
+    
+    def _load_scan_metadata(self, scan_dir: str) -> Dict:
+        """Load scan_metadata.json from a scan directory"""
+        return self._load_json_file(Path(scan_dir) / "scan_metadata.json")
     
-    def save_scan_metadata(self, target: str, scan_dir: str, is_baseline: bool = False, changes: List = None):
+    def _load_json_file(self, path: Path) -> Dict:
+        """Load a JSON object, returning an empty dict if missing or invalid"""
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def save_scan_metadata(self, target: str, scan_dir: str, is_baseline: bool = False, changes: List = None,
+                           fingerprint: Optional[str] = None):
         """Save scan metadata for tracking"""
         metadata = {
             "target": target,
             "scan_dir": scan_dir,
             "timestamp": datetime.now().isoformat(),
             "is_baseline": is_baseline,
-            "changes": changes or []
+            "changes": changes or [],
+            "fingerprint": fingerprint
         }
         
         metadata_file = Path(scan_dir) / "scan_metadata.json"
-        with open(metadata_file, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        metadata_file.write_bytes(dumps_json(metadata, indent=True))
+        
+        # Point the target at its newest processed scan
+        pointer = self.monitor_dir / target / self.LATEST_POINTER
+        tmp_pointer = pointer.with_name(pointer.name + ".tmp")
+        try:
+            tmp_pointer.write_text(scan_dir, encoding='utf-8')
+            os.replace(tmp_pointer, pointer)
+        except OSError as e:
+            print(f"[!] Error updating latest scan pointer: {e}")
     
     def schedule_scans(self):
         """Set up scheduled scans based on configuration"""
@@ -268,17 +374,17 @@ class ReconScheduler:
         
         # Hourly scans
         for target in schedules.get("hourly", []):
-            schedule.every().hour.do(self.scheduled_scan, target=target, scan_type="hourly")
+            schedule.every().hour.do(self.scheduled_scan, target, "hourly")
             print(f"[+] Scheduled hourly scan for {target}")
         
         # Daily scans
         for target in schedules.get("daily", []):
-            schedule.every().day.at("02:00").do(self.scheduled_scan, target=target, scan_type="daily")
+            schedule.every().day.at("02:00").do(self.scheduled_scan, target, "daily")
             print(f"[+] Scheduled daily scan for {target} at 02:00")
         
         # Weekly scans
         for target in schedules.get("weekly", []):
-            schedule.every().monday.at("03:00").do(self.scheduled_scan, target=target, scan_type="weekly")
+            schedule.every().monday.at("03:00").do(self.scheduled_scan, target, "weekly")
             print(f"[+] Scheduled weekly scan for {target} on Mondays at 03:00")
     
     def scheduled_scan(self, target: str, scan_type: str):
@@ -313,7 +419,9 @@ class ReconScheduler:
         try:
             while True:
                 schedule.run_pending()
-                time.sleep(60)  # Check every minute
+                # Sleep until the next job is due instead of polling every minute
+                idle = schedule.idle_seconds()
+                time.sleep(max(idle, 1) if idle is not None else 60)
         except KeyboardInterrupt:
             print(f"\n{Colors.YELLOW}[*]{Colors.ENDC} Monitoring stopped by user")
 
@@ -17,6 +17,17 @@ class ReconPlugin:
         """Unified logging for plugins"""
         self.logger.log(level, message)
 
+    async def _bounded(self, sem, coro):
+        """Await a probe coroutine while holding the concurrency semaphore"""
+        async with sem:
+            return await coro
+
+    def _log_failures(self, results):
+        """Log probe tasks that raised; gather(return_exceptions=True) returns their exceptions instead"""
+        for result in results:
+            if isinstance(result, BaseException):
+                self._log(f"Probe task failed: {result!r}", logging.WARNING)
+
     def _add_finding(self, recon, name: str, severity: str, matched_at: str, description: str = ""):
         """Helper to add a standard finding to the recon object"""
         recon.vulns.append({
@@ -9,20 +9,16 @@ try:
 except ImportError:
     _HAVE_AIOHTTP = False
 
+CLOUD_TECHS = frozenset({"aws", "amazon", "azure", "gcp", "google cloud", "s3", "bucket", "blob"})
+
 class CloudSecurityPlugin(ReconPlugin):
     name = "Cloud Security"
     description = "Checks for exposed cloud infrastructure (AWS/Azure/GCP) and probes bucket patterns"
     version = "1.0.0"
 
     async def run(self, recon):
-        cloud_techs = ["aws", "amazon", "azure", "gcp", "google cloud", "s3", "bucket", "blob"]
-        
         # 1. Tech Stack Detection
-        has_cloud = False
-        for techs in recon.tech_stack.values():
-            if any(t.lower() in cloud_techs for t in techs):
-                has_cloud = True
-                break
+        has_cloud = any(t.lower() in CLOUD_TECHS for techs in recon.tech_stack.values() for t in techs)
         
         # 2. Add Active Bucket Probing (Proactive Discovery)
         target_slug = recon.target.split(".")[0]
@@ -57,23 +53,27 @@ class CloudSecurityPlugin(ReconPlugin):
             "azure": "blob.core.windows.net"
         }
         
-        # Limit concurrency for probes
-        connector = aiohttp.TCPConnector(limit=10, limit_per_host=5)
-        async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=5)) as session:
+        # Limit concurrency for probes; every probe hits the same three provider hosts
+        sem = asyncio.Semaphore(20)
+        connector = aiohttp.TCPConnector(limit=20, limit_per_host=5, ttl_dns_cache=300, use_dns_cache=True)
+        async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=5),
+                                         raise_for_status=False) as session:
             tasks = []
             for b_name in buckets:
                 # AWS S3
-                tasks.append(self._check_bucket(session, f"https://{b_name}.{providers['aws']}", "AWS S3", recon))
+                tasks.append(self._check_bucket(session, f"https://{b_name}.{providers['aws']}", "AWS S3", recon, sem))
                 # GCP
-                tasks.append(self._check_bucket(session, f"https://{providers['gcp']}/{b_name}", "GCP Bucket", recon))
+                tasks.append(self._check_bucket(session, f"https://{providers['gcp']}/{b_name}", "GCP Bucket", recon, sem))
                 # Azure
-                tasks.append(self._check_bucket(session, f"https://{b_name}.{providers['azure']}", "Azure Blob", recon))
+                tasks.append(self._check_bucket(session, f"https://{b_name}.{providers['azure']}", "Azure Blob", recon, sem))
             
-            await asyncio.gather(*tasks)
+            # Handle results as they arrive rather than waiting on the slowest probe
+            for probe in asyncio.as_completed(tasks):
+                await probe
 
-    async def _check_bucket(self, session, url, provider, recon):
+    async def _check_bucket(self, session, url, provider, recon, sem):
         try:
-            async with session.head(url, allow_redirects=True) as resp:
+            async with sem, session.head(url, allow_redirects=True) as resp:
                 if resp.status in [200, 403]: # 403 means it exists but protected
                     msg = "Publicly Accessible" if resp.status == 200 else "Protected"
                     self._log(f"Cloud Bucket Identified ({provider}): {url} [{msg}]", logging.WARNING)
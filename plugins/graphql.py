@@ -46,14 +46,15 @@ class GraphQLDiscoveryPlugin(ReconPlugin):
             self._log("aiohttp not found. Skipping GraphQL probing.", logging.WARNING)
 
     async def _probe_graphql_endpoints(self, recon, targets):
-        connector = aiohttp.TCPConnector(ssl=False, limit=recon.threads, limit_per_host=30)
+        connector = aiohttp.TCPConnector(ssl=False, limit=recon.threads, limit_per_host=30, ttl_dns_cache=300)
         async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=10)) as session:
+            sem = asyncio.Semaphore(recon.threads)
             tasks = []
             for base_url in list(targets)[:100]: # Safety limit
                 for path in self.GRAPHQL_PATHS:
-                    tasks.append(self._check_endpoint(session, f"{base_url.rstrip('/')}{path}", recon))
+                    tasks.append(self._bounded(sem, self._check_endpoint(session, f"{base_url.rstrip('/')}{path}", recon)))
             
-            await asyncio.gather(*tasks)
+            self._log_failures(await asyncio.gather(*tasks, return_exceptions=True))
 
     async def _check_endpoint(self, session, url, recon):
         if not await recon.circuit_breaker.check_can_proceed():
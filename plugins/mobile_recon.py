@@ -8,9 +8,9 @@ class MobileReconPlugin(ReconPlugin):
 
     # Patterns for mobile-specific assets and endpoints
     MOBILE_PATTERNS = {
-        "deep_link_scheme": r"([a-z0-9][a-z0-9+.-]*://[^\s\"']+)",
-        "android_package": r"com\.[a-z0-9]+\.[a-z0-9.]+",
-        "apple_app_id": r"id[0-9]{9,10}",
+        "deep_link_scheme": re.compile(r"([a-z0-9][a-z0-9+.-]*://[^\s\"']+)"),
+        "android_package": re.compile(r"com\.[a-z0-9]+\.[a-z0-9.]+"),
+        "apple_app_id": re.compile(r"id[0-9]{9,10}"),
     }
 
     MOBILE_FILES = [
@@ -29,7 +29,7 @@ class MobileReconPlugin(ReconPlugin):
         for url in recon.urls:
             # Check for deep links in the URL itself (unlikely but possible in some formats)
             for name, pattern in self.MOBILE_PATTERNS.items():
-                matches = re.findall(pattern, url)
+                matches = pattern.findall(url)
                 if matches:
                     for m in matches:
                         found_links.add((name, m))
@@ -46,18 +46,31 @@ class MobileReconPlugin(ReconPlugin):
 
     async def _probe_mobile_files(self, recon):
         """Check for common mobile-web association files"""
+        import asyncio
         import aiohttp
-        connector = aiohttp.TCPConnector(ssl=False, limit=recon.threads)
+        connector = aiohttp.TCPConnector(ssl=False, limit=recon.threads, ttl_dns_cache=300)
         async with aiohttp.ClientSession(connector=connector) as session:
+            sem = asyncio.Semaphore(recon.threads)
+            tasks = []
             for domain in list(recon.live_domains)[:20]: # Limit for performance
                 base_url = f"https://{domain}" if not domain.startswith("http") else domain
                 for file_path in self.MOBILE_FILES:
                     target = f"{base_url.rstrip('/')}/{file_path}"
-                    try:
-                        async with session.get(target, timeout=5) as resp:
-                            if resp.status == 200:
-                                self._log(f"Found mobile association file: {target}")
-                                self._add_finding(recon, "Mobile Association File Found", "info", target, 
-                                                description=f"File {file_path} found on {domain}. This helps map mobile app to web domain.")
-                    except:
-                        pass
+                    tasks.append(self._bounded(sem, self._check_mobile_file(session, recon, domain, file_path, target)))
+            
+            self._log_failures(await asyncio.gather(*tasks, return_exceptions=True))
+
+    async def _check_mobile_file(self, session, recon, domain, file_path, target):
+        try:
+            # Only the status matters: HEAD first, GET if the server rejects HEAD
+            async with session.head(target, timeout=5, allow_redirects=True) as resp:
+                status = resp.status
+            if status == 405:
+                async with session.get(target, timeout=5) as resp:
+                    status = resp.status
+            if status == 200:
+                self._log(f"Found mobile association file: {target}")
+                self._add_finding(recon, "Mobile Association File Found", "info", target, 
+                                description=f"File {file_path} found on {domain}. This helps map mobile app to web domain.")
+        except:
+            pass
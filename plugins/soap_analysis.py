@@ -40,15 +40,16 @@ class SOAPAnalysisPlugin(ReconPlugin):
             await self._probe_soap_endpoints(recon, targets)
 
     async def _probe_soap_endpoints(self, recon, targets):
-        connector = aiohttp.TCPConnector(ssl=False, limit=recon.threads, limit_per_host=30)
+        connector = aiohttp.TCPConnector(ssl=False, limit=recon.threads, limit_per_host=30, ttl_dns_cache=300)
         async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=10)) as session:
+            sem = asyncio.Semaphore(recon.threads)
             tasks = []
             for base_url in list(targets)[:50]:
                 for path in self.SOAP_PATHS:
                     url = base_url + path if "?" not in base_url else base_url + path.replace("?", "&")
-                    tasks.append(self._check_wsdl(session, url, recon))
+                    tasks.append(self._bounded(sem, self._check_wsdl(session, url, recon)))
             
-            await asyncio.gather(*tasks)
+            self._log_failures(await asyncio.gather(*tasks, return_exceptions=True))
 
     async def _check_wsdl(self, session, url, recon):
         if not await recon.circuit_breaker.check_can_proceed():
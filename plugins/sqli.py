@@ -3,7 +3,10 @@ import os
 import asyncio
 import logging
 import re
-from typing import List, Set
+import json
+import mmap
+from typing import List, Optional, Set
+from urllib.parse import urlsplit, parse_qsl
 
 try:
     import aiohttp
@@ -11,6 +14,34 @@ try:
 except ImportError:
     _HAVE_AIOHTTP = False
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import hyperscan
+    _HAVE_HYPERSCAN = True
+except ImportError:
+    _HAVE_HYPERSCAN = False
+
+try:
+    import re2
+    _HAVE_RE2 = True
+except ImportError:
+    _HAVE_RE2 = False
+
+
+def _compile_linear(pattern: str):
+    """Compile with RE2 (linear time, no backtracking) when available, else Python re"""
+    if _HAVE_RE2:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern)
+
 class SQLiPlugin(ReconPlugin):
     name = "VIP SQLi Scanner"
     description = "Advanced SQL injection detection engine using heuristics and nuclei"
@@ -35,6 +66,25 @@ class SQLiPlugin(ReconPlugin):
         r"Microsoft OLE DB Provider for ODBC Drivers",
     ]
 
+    # All patterns in one case-insensitive pass; group "p<i>" identifies ERROR_PATTERNS[i]
+    ERROR_RE = _compile_linear("(?i)" + "|".join(f"(?P<p{i}>{p})" for i, p in enumerate(ERROR_PATTERNS)))
+
+    # Heuristic payloads appended to the first parameter value
+    PAYLOADS = ["'", "\"", "')"]
+
+    # Lower-case literals at least one of which occurs in any ERROR_PATTERNS match
+    ERROR_ANCHORS = (
+        "sql syntax", "mysql", "check the manual", "unknown column", "where clause",
+        "postgresql", "mssql_query", "sql server", "ora-", "oracle error",
+        "sqlite", "sqlexception", "odbc drivers",
+    )
+
+    # SQL errors surface near the top of the page; bound the bytes read and scanned
+    MAX_SCAN_BYTES = 64 * 1024
+
+    # Hyperscan database for ERROR_PATTERNS, compiled on first use
+    _hs_db = None
+
     async def run(self, recon):
         self._log("Starting VIP SQLi Engine analysis...")
         
@@ -46,107 +96,180 @@ class SQLiPlugin(ReconPlugin):
 
         self._log(f"Detected {len(dynamic_urls)} dynamic targets. Running diagnostics...")
 
-        # 2. Run Nuclei with SQLi tags specifically on these targets
-        temp_file = os.path.join(recon.output_dir, "vulns", "sqli_targets.txt")
-        os.makedirs(os.path.dirname(temp_file), exist_ok=True)
-        
-        with open(temp_file, "w") as f:
-            for url in dynamic_urls:
-                f.write(url + "\n")
-
+        # 2. Run Nuclei with SQLi tags specifically on these targets (fed via stdin)
         sqli_results = os.path.join(recon.output_dir, "vulns", "sqli_nuclei.json")
+        os.makedirs(os.path.dirname(sqli_results), exist_ok=True)
         cmd = [
-            "nuclei", "-l", temp_file,
+            "nuclei",
             "-tags", "sqli,dast,injection",
             "-o", sqli_results,
             "-silent", "-severity", "critical,high,medium"
         ]
         
         # Run nuclei in background
-        nuclei_task = recon._run_command(cmd)
+        nuclei_task = recon._run_command(cmd, input_data="\n".join(dynamic_urls) + "\n")
 
         # 3. Native Heuristic Scanning (simulating VIP Engine)
         if _HAVE_AIOHTTP:
-            heuristic_task = self._run_heuristic_scan(recon, dynamic_urls)
+            # Reuse the scan-wide keep-alive pool when the runner has one
+            get_session = getattr(recon, "_get_session", None)
+            session = await get_session() if get_session else None
+            heuristic_task = self._run_heuristic_scan(recon, dynamic_urls, session)
             await asyncio.gather(nuclei_task, heuristic_task)
         else:
             await nuclei_task
 
-        # Cleanup
-        if os.path.exists(temp_file):
-            os.remove(temp_file)
-        
         # Parse nuclei results into recon.vulns
         if os.path.exists(sqli_results):
-            self._parse_results(recon, sqli_results)
+            await asyncio.to_thread(self._parse_results, recon, sqli_results)
 
     def _get_dynamic_urls(self, urls: Set[str]) -> List[str]:
-        """Filter URLs that have query parameters"""
-        dynamic = []
+        """Filter URLs that have query parameters, keeping one per injection point"""
+        # URLs differing only in parameter values (?id=1, ?id=2) share a signature
+        seen = {}
         for url in urls:
-            if "?" in url and "=" in url:
-                dynamic.append(url)
-        return list(set(dynamic))
+            if "?" not in url or "=" not in url:
+                continue
+            parts = urlsplit(url)
+            params = tuple(sorted({k for k, _ in parse_qsl(parts.query, keep_blank_values=True)}))
+            if not params:
+                continue
+            seen.setdefault((parts.scheme, parts.netloc, parts.path, params), url)
+        return list(seen.values())
 
-    async def _run_heuristic_scan(self, recon, urls: List[str]):
+    async def _run_heuristic_scan(self, recon, urls: List[str], session=None):
         """Perform light-weight heuristic SQLi checks (The 'VIP' logic)"""
-        # Simple detection: append a single quote and check for errors
-        payloads = ["'", "\"", "')"]
+        if session is None:
+            # One keep-alive pool for every probe; the probed URLs share a handful of hosts
+            connector = aiohttp.TCPConnector(ssl=False, limit=recon.threads, limit_per_host=recon.threads,
+                                             ttl_dns_cache=300, keepalive_timeout=30)
+            async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=10)) as session:
+                return await self._run_heuristic_scan(recon, urls, session)
+
+        # Bound in-flight probes so queued ones still see an opened circuit breaker
+        sem = asyncio.Semaphore(recon.threads)
+        tasks = [self._bounded(sem, self._probe_url(session, url, recon)) for url in urls[:50]] # Limit heuristics for speed
         
-        connector = aiohttp.TCPConnector(ssl=False, limit=recon.threads, limit_per_host=30)
-        async with aiohttp.ClientSession(connector=connector) as session:
-            tasks = []
-            for url in urls[:50]: # Limit heuristics for speed
-                for p in payloads:
-                    test_url = self._inject_payload(url, p)
-                    tasks.append(self._check_url(session, test_url, recon))
-            
-            results = await asyncio.gather(*tasks)
-            found_vulns = [r for r in results if r]
-            
-            if found_vulns:
-                self._log(f"VIP Engine found {len(found_vulns)} potential SQLi vulnerabilities via heuristics!", logging.WARNING)
-                # Write to specialized file
-                sqli_file = os.path.join(recon.output_dir, "vulns", "sqli_findings_native.txt")
-                with open(sqli_file, "a") as f:
-                    for v in found_vulns:
-                        f.write(f"Vulnerable URL: {v['url']}\nPattern: {v['pattern']}\n\n")
-
-    def _inject_payload(self, url: str, payload: str) -> str:
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        found_vulns = [v for r in results if not isinstance(r, BaseException) for v in r]
+        
+        if found_vulns:
+            self._log(f"VIP Engine found {len(found_vulns)} potential SQLi vulnerabilities via heuristics!", logging.WARNING)
+            # Write to specialized file
+            sqli_file = os.path.join(recon.output_dir, "vulns", "sqli_findings_native.txt")
+            with open(sqli_file, "a") as f:
+                f.write("".join(f"Vulnerable URL: {v['url']}\nPattern: {v['pattern']}\n\n" for v in found_vulns))
+
+    async def _probe_url(self, session, url: str, recon) -> List[dict]:
+        """Send every payload for one URL in turn, reusing its keep-alive connection"""
+        # Simple detection: append a single quote and check for errors
+        found = []
+        for p in self.PAYLOADS:
+            vuln = await self._check_url(session, self._inject_payload(url, p), recon)
+            if vuln:
+                found.append(vuln)
+        return found
+
+    @staticmethod
+    def _inject_payload(url: str, payload: str) -> str:
         """Inject payload into the first found parameter"""
-        if "=" not in url: return url
-        parts = url.split("=", 1)
-        return f"{parts[0]}={parts[1]}{payload}"
+        # Splitting on the first "=" and rejoining rebuilds the URL, so this is a plain append
+        return url + payload if "=" in url else url
 
     async def _check_url(self, session, url, recon):
         if not await recon.circuit_breaker.check_can_proceed():
             return None
             
         try:
+            # Explicit per-request bound: an injected session may carry a longer (or no) total timeout
             async with session.get(url, timeout=10) as resp:
-                text = await resp.text()
-                for pattern in self.ERROR_PATTERNS:
-                    if re.search(pattern, text, re.IGNORECASE):
-                        vuln = {
-                            "url": url,
-                            "pattern": pattern,
-                            "severity": "high"
-                        }
-                        self._add_finding(recon, "SQL Injection (Heuristic)", "high", url, description=f"Error pattern matched: {pattern}")
-                        return vuln
+                text = await self._read_head(resp, self.MAX_SCAN_BYTES)
+                pattern = self._match_error_pattern(text)
+                if pattern:
+                    vuln = {
+                        "url": url,
+                        "pattern": pattern,
+                        "severity": "high"
+                    }
+                    self._add_finding(recon, "SQL Injection (Heuristic)", "high", url, description=f"Error pattern matched: {pattern}")
+                    return vuln
         except Exception:
             pass
         return None
 
+    async def _read_head(self, resp, limit: int) -> str:
+        """Read and decode at most `limit` bytes of the response body"""
+        buf = bytearray()
+        async for chunk in resp.content.iter_chunked(8192):
+            buf += chunk
+            if len(buf) >= limit:
+                break
+        return bytes(buf[:limit]).decode(resp.charset or "utf-8", "ignore")
+
+    def _match_error_pattern(self, text: str) -> Optional[str]:
+        """Return the ERROR_PATTERNS entry found in the response text, if any"""
+        text = text[:self.MAX_SCAN_BYTES]
+        # Cheap substring prescreen: most pages contain none of the anchors
+        lowered = text.lower()
+        if not any(anchor in lowered for anchor in self.ERROR_ANCHORS):
+            return None
+
+        db = self._get_hs_db() if _HAVE_HYPERSCAN else None
+        if db is None:
+            match = self.ERROR_RE.search(text)
+            if not match:
+                return None
+            group = next(name for name, value in match.groupdict().items() if value is not None)
+            return self.ERROR_PATTERNS[int(group[1:])]
+
+        hits = []
+
+        def on_match(pattern_id, start, end, flags, context):
+            hits.append(pattern_id)
+            return True  # Stop at the first hit
+
+        try:
+            db.scan(text.encode("utf-8", "ignore"), match_event_handler=on_match)
+        except hyperscan.error:
+            # Raised when the callback halts the scan
+            if not hits:
+                raise
+        return self.ERROR_PATTERNS[hits[0]] if hits else None
+
+    def _get_hs_db(self):
+        """Compile ERROR_PATTERNS into a Hyperscan block-mode database once"""
+        cls = type(self)
+        if cls._hs_db is None:
+            try:
+                db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+                db.compile(
+                    expressions=[p.encode() for p in cls.ERROR_PATTERNS],
+                    ids=list(range(len(cls.ERROR_PATTERNS))),
+                    flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(cls.ERROR_PATTERNS)
+                )
+                cls._hs_db = db
+            except Exception as e:
+                self._log(f"Hyperscan compile failed, falling back to re: {e}", logging.WARNING)
+                cls._hs_db = False
+        return cls._hs_db or None
+
     def _parse_results(self, recon, results_file):
         try:
-            with open(results_file, "r") as f:
-                import json
-                for line in f:
-                    try:
-                        data = json.loads(line)
-                        recon.vulns.append(data)
-                    except:
-                        continue
+            with open(results_file, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return
+                # Slice newline-delimited records straight out of the mapping
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    start, end = 0, len(mm)
+                    while start < end:
+                        nl = mm.find(b"\n", start)
+                        if nl < 0:
+                            nl = end
+                        if nl > start:
+                            try:
+                                recon.vulns.append(_json_loads(mm[start:nl]))
+                            except ValueError:
+                                pass
+                        start = nl + 1
         except Exception as e:
             self._log(f"Error parsing SQLi results: {e}", logging.ERROR)
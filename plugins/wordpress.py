@@ -1,39 +1,36 @@
 from plugins.base import ReconPlugin
 import os
 import logging
+from urllib.parse import urlsplit
 
 logger = logging.getLogger("ReconMaster.Plugins.WordPress")
 
+WP_TECHS = frozenset({"wordpress", "wp"})
+
 class WordPressPlugin(ReconPlugin):
     name = "WordPress Scanner"
     description = "Specialized scanning for WordPress sites"
     version = "1.0.0"
 
     async def run(self, recon):
-        # Check if WordPress is in tech stack
-        wp_targets = []
+        # Check if WordPress is in tech stack, scanning each origin only once
+        origins = {}
         for url, techs in recon.tech_stack.items():
-            if any(x.lower() in ["wordpress", "wp"] for x in techs):
-                wp_targets.append(url)
+            if any(x.lower() in WP_TECHS for x in techs):
+                parts = urlsplit(url)
+                origins.setdefault((parts.scheme, parts.netloc) if parts.netloc else url, url)
+        wp_targets = list(origins.values())
         
         if not wp_targets:
             return
 
         self._log(f"WordPress detected on {len(wp_targets)} targets. Running specialized templates...")
         
-        # Save targets to temp file
-        temp_file = os.path.join(recon.output_dir, "vulns", "wp_targets.txt")
-        with open(temp_file, "w") as f:
-            for t in wp_targets:
-                f.write(t + "\n")
-
+        # Feed targets to nuclei on stdin
         cmd = [
-            "nuclei", "-l", temp_file,
+            "nuclei",
             "-tags", "wordpress,wp-plugin",
             "-o", os.path.join(recon.output_dir, "vulns", "wp_nuclei.json"),
             "-silent"
         ]
-        await recon._run_command(cmd)
-        
-        if os.path.exists(temp_file):
-            os.remove(temp_file)
+        await recon._run_command(cmd, input_data="\n".join(wp_targets) + "\n")
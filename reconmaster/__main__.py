@@ -15,13 +15,20 @@ from .modules.screenshot import ScreenshotModule
 from .modules.port_scan import PortScanModule
 from .reporting import ReportingManager
 
+# uvloop is a faster drop-in event loop on Linux/macOS; Windows keeps the stdlib loop
+try:
+    import uvloop
+    _HAVE_UVLOOP = True
+except ImportError:
+    _HAVE_UVLOOP = False
+
 # Configure root logger
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
 logger = logging.getLogger("ReconMaster")
 
 async def run_scan(args):
     """Main scanning orchestration"""
-    start_time = time.time()
+    start_time = time.monotonic()
     
     recon = ReconMaster(
         target=args.domain,
@@ -82,15 +89,13 @@ async def run_scan(args):
                          "matched-at": recon.target
                     })
             
-            # Dependent tasks
-            try:
-                await js_module.analyze_js()
-                await port_scan.scan()
-            except Exception as e:
-                logger.error(f"Dependent Task Failed: {e}")
+            # Dependent tasks: both need Phase 3 output but not each other
+            for result in await asyncio.gather(js_module.analyze_js(), port_scan.scan(), return_exceptions=True):
+                if isinstance(result, Exception):
+                    logger.error(f"Dependent Task Failed: {result}")
 
         # Phase 4: Reporting
-        duration = f"{time.time() - start_time:.2f}s"
+        duration = f"{time.monotonic() - start_time:.2f}s"
         reporting.generate_all(duration)
 
     finally:
@@ -115,6 +120,8 @@ def main():
         print("[!] Error: You must confirm authorization with --i-understand-this-requires-authorization")
         sys.exit(1)
 
+    if _HAVE_UVLOOP:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(run_scan(args))
 
 if __name__ == "__main__":
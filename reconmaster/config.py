@@ -1,5 +1,6 @@
 import os
 import sys
+import copy
 import yaml
 import logging
 import re
@@ -7,8 +8,15 @@ from typing import Dict, Any
 
 logger = logging.getLogger("ReconMaster.Config")
 
+# Prefer the libyaml C parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 class Config:
     """Configuration parser and validator for ReconMaster."""
+
+    # Parsed, validated configs keyed by path, invalidated on (mtime_ns, size) change.
+    # Instances get deep copies, so one caller mutating its config can't leak into another.
+    _cache: Dict[str, tuple] = {}
     
     def __init__(self, config_path: str = "config.yaml"):
         self.config_path = config_path
@@ -22,9 +30,17 @@ class Config:
             logger.info(f"Created default configuration at {self.config_path}")
             
         try:
+            st = os.stat(self.config_path)
+            key = os.path.abspath(self.config_path)
+            cached = self._cache.get(key)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                self._data = copy.deepcopy(cached[2])
+                return
+
             with open(self.config_path, 'r') as f:
-                self._data = yaml.safe_load(f) or {}
+                self._data = yaml.load(f, Loader=_YAML_LOADER) or {}
             self._validate()
+            self._cache[key] = (st.st_mtime_ns, st.st_size, copy.deepcopy(self._data))
         except yaml.YAMLError as e:
             logger.error(f"Failed to parse config.yaml: {e}")
             sys.exit(1)
@@ -16,6 +16,13 @@ logger = logging.getLogger("ReconMaster.Core")
 
 class ReconMaster:
     """Core orchestrator for the ReconMaster framework"""
+    # Target validation patterns, compiled once
+    DOMAIN_CHARS_RE = re.compile(r'^[a-zA-Z0-9.-]+$')
+    PRIVATE_TARGET_RE = re.compile(
+        r'^(?:localhost|127\.|192\.168\.|10\.|172\.(?:1[6-9]|2[0-9]|3[0-1])\.|.*\.local$|.*\.internal$)',
+        re.IGNORECASE
+    )
+
     def __init__(self, target: str, output_dir: str, threads: Optional[int] = None, wordlist: Optional[str] = None):
         self.config = Config()
         self.target = self._validate_target(target)
@@ -57,10 +64,15 @@ class ReconMaster:
             "summary": os.path.join(self.dirs["base"], "summary.json"),
             "executive_report": os.path.join(self.dirs["base"], "executive_report.md"),
             "full_report": os.path.join(self.dirs["base"], "full_report.html"),
+            "subfinder": os.path.join(self.dirs["subdomains"], "subfinder.txt"),
+            "assetfinder": os.path.join(self.dirs["subdomains"], "assetfinder.txt"),
+            "amass": os.path.join(self.dirs["subdomains"], "amass.txt"),
+            "all_passive": os.path.join(self.dirs["subdomains"], "all_passive.txt"),
             "all_subdomains": os.path.join(self.dirs["subdomains"], "all_subdomains.txt"),
             "live_subdomains": os.path.join(self.dirs["subdomains"], "live_subdomains.txt"),
             "alive": os.path.join(self.dirs["http"], "alive.txt"),
             "httpx_full": os.path.join(self.dirs["http"], "httpx_full.json"),
+            "httpx_results": os.path.join(self.dirs["http"], "httpx_results.json"),
             "technologies": os.path.join(self.dirs["http"], "technologies.json"),
             "nuclei_results": os.path.join(self.dirs["vulns"], "nuclei_results.json"),
             "vuln_critical": os.path.join(self.dirs["vulns"], "critical.txt"),
@@ -98,17 +110,12 @@ class ReconMaster:
             target = target.split("://")[-1]
         target = target.split("/")[0].strip()
         
-        if not target or not re.match(r'^[a-zA-Z0-9.-]+$', target):
+        if not target or not self.DOMAIN_CHARS_RE.match(target):
             raise ValueError(f"Invalid domain format: {target}")
             
         # Prevent private IP/localhost targeting
-        private_patterns = [
-            r'^localhost', r'^127\.', r'^192\.168\.', r'^10\.', 
-            r'^172\.(1[6-9]|2[0-9]|3[0-1])\.', r'.*\.local$', r'.*\.internal$'
-        ]
-        for pattern in private_patterns:
-            if re.match(pattern, target, re.IGNORECASE):
-                raise ValueError(f"Security Restriction: Cannot scan private infrastructure: {target}")
+        if self.PRIVATE_TARGET_RE.match(target):
+            raise ValueError(f"Security Restriction: Cannot scan private infrastructure: {target}")
         
         return target
 
@@ -127,8 +134,14 @@ class ReconMaster:
             "logs": os.path.join(self.output_dir, "logs"),
             "nmap": os.path.join(self.output_dir, "nmap") # Added nmap dir
         }
-        for d in self.dirs.values():
-            os.makedirs(d, exist_ok=True)
+        # Parents precede children in self.dirs: one makedirs for the base, then a bare mkdir each
+        os.makedirs(self.dirs["base"], exist_ok=True)
+        for d in list(self.dirs.values())[1:]:
+            try:
+                os.mkdir(d)
+            except FileExistsError:
+                if not os.path.isdir(d):
+                    raise
 
     def _setup_logging(self):
         """Initialize file logging for this scan instance"""
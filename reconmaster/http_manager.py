@@ -1,4 +1,4 @@
-import asyncio
+import ssl
 import time
 import random
 import logging
@@ -8,6 +8,9 @@ from datetime import datetime
 
 logger = logging.getLogger("ReconMaster.HTTP")
 
+# HTTP statuses that signal throttling/blocking and feed the circuit breaker
+THROTTLE_STATUSES = frozenset({403, 429, 503})
+
 class CircuitBreaker:
     """Unified circuit breaker for all HTTP operations to prevent rate limiting and saturation"""
     def __init__(self, threshold: int = 10, timeout: int = 60):
@@ -16,53 +19,55 @@ class CircuitBreaker:
         self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
         self.open_time = 0.0
         self.timeout = timeout
-        self.lock = asyncio.Lock()
+        # No lock. This is only safe because every method below reads and updates state with no
+        # await in between, so on the single event loop thread no other coroutine can run in the
+        # middle of a transition. Adding an await inside one of them (e.g. to log or notify
+        # asynchronously) reintroduces the race; put the asyncio.Lock back if that is ever needed.
     
     async def record_error(self, status_code: int):
         """Record failed request and potentially open the circuit"""
-        async with self.lock:
-            if status_code in [403, 429, 503]:
-                self.error_count += 1
-                logger.warning(f"Circuit breaker alert: {self.error_count}/{self.threshold} errors recorded.")
-                
-                if self.error_count >= self.threshold and self.state == "CLOSED":
-                    self.state = "OPEN"
-                    self.open_time = time.time()
-                    logger.error(f"🚫 CIRCUIT BREAKER OPENED - Rate limiting detected. Cooling down for {self.timeout}s.")
+        if status_code in THROTTLE_STATUSES:
+            self.error_count += 1
+            logger.warning("Circuit breaker alert: %d/%d errors recorded.", self.error_count, self.threshold)
+
+            if self.error_count >= self.threshold and self.state == "CLOSED":
+                self.state = "OPEN"
+                self.open_time = time.monotonic()
+                logger.error(f"🚫 CIRCUIT BREAKER OPENED - Rate limiting detected. Cooling down for {self.timeout}s.")
                 
     async def record_success(self):
         """Record successful request and recovery"""
-        async with self.lock:
-            if self.error_count > 0:
-                self.error_count = max(0, self.error_count - 1)
-            
-            if self.state == "HALF_OPEN":
-                self.state = "CLOSED"
-                logger.info("✅ Circuit breaker CLOSED - System recovered.")
+        if self.error_count > 0:
+            self.error_count -= 1
+
+        if self.state == "HALF_OPEN":
+            self.state = "CLOSED"
+            logger.info("✅ Circuit breaker CLOSED - System recovered.")
     
     async def check_can_proceed(self) -> bool:
         """Check if requests can proceed based on current state"""
-        async with self.lock:
-            if self.state == "CLOSED":
-                return True
-            
-            if self.state == "OPEN":
-                elapsed = time.time() - self.open_time
-                if elapsed > self.timeout:
-                    self.state = "HALF_OPEN"
-                    logger.info("🔌 Circuit breaker Entering HALF_OPEN - testing connectivity.")
-                    return True
-                return False
-            
-            # HALF_OPEN - allow requests but monitor closely
+        if self.state == "CLOSED":
             return True
 
+        if self.state == "OPEN":
+            elapsed = time.monotonic() - self.open_time
+            if elapsed > self.timeout:
+                self.state = "HALF_OPEN"
+                logger.info("🔌 Circuit breaker Entering HALF_OPEN - testing connectivity.")
+                return True
+            return False
+
+        # HALF_OPEN - allow requests but monitor closely
+        return True
+
 class HTTPManager:
     """Centralized manager for HTTP sessions, circuit breakers, and security policies"""
     def __init__(self, threads: int = 10, timeout: int = 20, verify_ssl: bool = True):
         self.threads = threads
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.verify_ssl = verify_ssl
+        # Built once: loading the CA bundle is the expensive part of a verifying context
+        self.ssl_context = ssl.create_default_context() if verify_ssl else False
         self.circuit_breaker = CircuitBreaker()
         self.user_agents = [
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
@@ -75,7 +80,7 @@ class HTTPManager:
     async def get_session(self) -> aiohttp.ClientSession:
         """Initialize or return the existing ClientSession"""
         if self._session is None or self._session.closed:
-            connector = aiohttp.TCPConnector(ssl=self.verify_ssl, limit=self.threads, limit_per_host=30)
+            connector = aiohttp.TCPConnector(ssl=self.ssl_context, limit=self.threads, limit_per_host=30, ttl_dns_cache=300)
             self._session = aiohttp.ClientSession(timeout=self.timeout, connector=connector)
         return self._session
 
@@ -87,7 +92,7 @@ class HTTPManager:
     async def request(self, method: str, url: str, **kwargs) -> Optional[aiohttp.ClientResponse]:
         """Perform an HTTP request with circuit breaker protection"""
         if not await self.circuit_breaker.check_can_proceed():
-            logger.warning(f"Circuit breaker OPEN/COOLDOWN - skipping request: {url}")
+            logger.warning("Circuit breaker OPEN/COOLDOWN - skipping request: %s", url)
             return None
 
         session = await self.get_session()
@@ -100,7 +105,7 @@ class HTTPManager:
 
         try:
             async with session.request(method, url, **kwargs) as response:
-                if response.status in [403, 429, 503]:
+                if response.status in THROTTLE_STATUSES:
                     await self.circuit_breaker.record_error(response.status)
                 else:
                     await self.circuit_breaker.record_success()
@@ -109,6 +114,6 @@ class HTTPManager:
                 await response.read()
                 return response
         except Exception as e:
-            logger.debug(f"HTTP request failed for {url}: {e}")
+            logger.debug("HTTP request failed for %s: %s", url, e)
             await self.circuit_breaker.record_error(500)
             return None
@@ -15,8 +15,8 @@ class AnalysisModule:
     async def scan_vulns(self):
         """Run nuclei for vulnerability detection"""
         logger.info("Starting vulnerability scan with Nuclei")
-        alive_txt = os.path.join(self.recon.dirs["http"], "alive.txt")
-        vuln_json = os.path.join(self.recon.dirs["vulns"], "nuclei_results.json")
+        alive_txt = self.recon.files["alive"]
+        vuln_json = self.recon.files["nuclei_results"]
         
         cmd = [
             "nuclei", "-l", alive_txt, "-json", "-o", vuln_json,
@@ -35,8 +35,8 @@ class AnalysisModule:
     async def crawl_endpoints(self):
         """Crawl endpoints using Katana"""
         logger.info("Starting deep crawl with Katana")
-        alive_txt = os.path.join(self.recon.dirs["http"], "alive.txt")
-        urls_txt = os.path.join(self.recon.dirs["endpoints"], "all_urls.txt")
+        alive_txt = self.recon.files["alive"]
+        urls_txt = self.recon.files["all_urls"]
         
         cmd = [
             "katana", "-list", alive_txt, "-jc", "-o", urls_txt,
@@ -45,13 +45,15 @@ class AnalysisModule:
         await self.recon.tools.run_command(cmd, timeout=1200)
         
         if os.path.exists(urls_txt):
-            with open(urls_txt, "r") as f:
-                for line in f:
-                    url = line.strip()
-                    if url:
-                        self.recon.urls.add(url)
-                        if ".js" in url.lower().split("?")[0]:
-                            self.recon.js_files.add(url)
+            with open(urls_txt, "rb") as f:
+                data = f.read()
+            for raw in data.splitlines():
+                raw = raw.strip()
+                if raw:
+                    url = raw.decode("utf-8", "replace")
+                    self.recon.urls.add(url)
+                    if ".js" in url.lower().split("?")[0]:
+                        self.recon.js_files.add(url)
 
     async def analyze_js(self):
         """Analyze JS files for secrets using centralized HTTP manager"""
@@ -6,9 +6,22 @@ import re
 import random
 from typing import List, Dict, Any, Optional, Set
 from ..core import ReconMaster
+from ..utils import write_lines
 
 logger = logging.getLogger("ReconMaster.JS")
 
+# Secret and endpoint patterns applied to every downloaded JS file
+JS_PATTERNS = {
+    "google_api": re.compile(r"AIza[0-9A-Za-z-_]{35}"),
+    "amazon_aws_key": re.compile(r"AKIA[0-9A-Z]{16}"),
+    "slack_token": re.compile(r"xox[baprs]-[0-9a-zA-Z]{10,48}"),
+    "stripe_api_key": re.compile(r"sk_live_[0-9a-zA-Z]{24}"),
+    "endpoint": re.compile(r"(?:https?://|/)[a-zA-Z0-9.\-_/]+(?:\?[a-zA-Z0-9.\-_=&]+)?")
+}
+
+# URL substrings that flag a crawled endpoint as a likely admin panel
+ADMIN_KEYWORDS = ("admin", "login", "wp-admin", "dashboard")
+
 class JSModule:
     """Module for deep crawling with Katana and JS secret analysis"""
     def __init__(self, recon: ReconMaster):
@@ -29,42 +42,33 @@ class JSModule:
         await self.recon.tools.run_command(cmd, timeout=1200)
 
         if os.path.exists(self.recon.files["all_urls"]):
-            admin_panels = []
-            with open(self.recon.files["all_urls"], "r") as f:
-                for line in f:
-                    url = line.strip()
-                    if not url: continue
-                    self.recon.urls.add(url)
-                    if ".js" in url.lower().split("?")[0]:
-                        self.recon.js_files.add(url)
-                    
-                    admin_keywords = ["admin", "login", "wp-admin", "dashboard"]
-                    if any(kw in url.lower() for kw in admin_keywords) and not url.endswith((".js", ".css")):
-                        admin_panels.append(url)
+            admin_panels = set()
+            # One binary read; splitlines/strip run in C and only non-empty lines get decoded
+            with open(self.recon.files["all_urls"], "rb") as f:
+                data = f.read()
+            for raw in data.splitlines():
+                raw = raw.strip()
+                if not raw: continue
+                url = raw.decode("utf-8", "replace")
+                self.recon.urls.add(url)
+                lowered = url.lower()
+                if ".js" in lowered.split("?", 1)[0]:
+                    self.recon.js_files.add(url)
+
+                if any(kw in lowered for kw in ADMIN_KEYWORDS) and not url.endswith((".js", ".css")):
+                    admin_panels.add(url)
 
             if admin_panels:
-                with open(self.recon.files["admin_panels"], "w") as f:
-                    for panel in sorted(set(admin_panels)):
-                        f.write(panel + "\n")
+                await asyncio.to_thread(write_lines, self.recon.files["admin_panels"], sorted(admin_panels))
 
         if self.recon.js_files:
-            with open(self.recon.files["javascript_files"], "w") as f:
-                for js in sorted(self.recon.js_files):
-                    f.write(js + "\n")
+            await asyncio.to_thread(write_lines, self.recon.files["javascript_files"], sorted(self.recon.js_files))
 
     async def analyze_js(self):
         """Analyze JS files for secrets and endpoints"""
         if not self.recon.js_files: return
         logger.info(f"Analyzing {len(self.recon.js_files)} JS files...")
 
-        regex_list = {
-            "google_api": r"AIza[0-9A-Za-z-_]{35}",
-            "amazon_aws_key": r"AKIA[0-9A-Z]{16}",
-            "slack_token": r"xox[baprs]-[0-9a-zA-Z]{10,48}",
-            "stripe_api_key": r"sk_live_[0-9a-zA-Z]{24}",
-            "endpoint": r"(?:https?://|/)[a-zA-Z0-9.\-_/]+(?:\?[a-zA-Z0-9.\-_=&]+)?"
-        }
-
         async def scan_js(js_url):
             try:
                 resp = await self.recon.http.request("GET", js_url, timeout=15)
@@ -75,8 +79,8 @@ class JSModule:
                         content = content[:self.max_file_size_mb * 1024 * 1024]
 
                     findings = []
-                    for name, pattern in regex_list.items():
-                        matches = re.findall(pattern, content)
+                    for name, pattern in JS_PATTERNS.items():
+                        matches = pattern.findall(content)
                         if matches:
                             matches = list(set(matches))
                             if name == "endpoint":
@@ -85,7 +89,7 @@ class JSModule:
                                 findings.append((name, matches))
                     return js_url, findings
             except Exception as e:
-                logger.debug(f"JS scan failed for {js_url}: {e}")
+                logger.debug("JS scan failed for %s: %s", js_url, e)
             return js_url, []
 
         js_list = list(self.recon.js_files)[:self.max_js]
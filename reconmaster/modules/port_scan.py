@@ -1,4 +1,5 @@
 import os
+import asyncio
 import logging
 from typing import Set
 from ..core import ReconMaster
@@ -18,12 +19,24 @@ class PortScanModule:
         # Extract unique hostnames
         hosts = {url.replace("https://", "").replace("http://", "").split("/")[0].split(":")[0] for url in self.recon.live_domains}
         
-        # Limit to top 5 for reconnaissance efficiency
-        for host in list(hosts)[:5]:
+        # scan.rate_limit is a ceiling (requests/sec), as for ffuf; nmap's equivalent is --max-rate
+        rate = self.recon.config.get("scan.rate_limit")
+        rate_args = ["--max-rate", str(rate)] if rate else []
+
+        # Limit to top 5 for reconnaissance efficiency, in a stable order so reruns scan the same hosts.
+        # Scanned concurrently, capped one below ToolManager's semaphore so nmap never fills the whole
+        # pool (with a single thread it simply shares it)
+        top_hosts = sorted(hosts)[:5]
+        sem = asyncio.Semaphore(max(1, min(len(top_hosts), self.recon.threads - 1)))
+
+        async def scan_host(host):
             host_safe = host.replace(".", "_")
             out_file = os.path.join(self.recon.dirs["nmap"], f"{host_safe}.txt")
-            cmd = ["nmap", "--top-ports", "1000", "-T4", "--open", host, "-oN", out_file]
-            await self.recon.tools.run_command(cmd, timeout=300)
+            cmd = ["nmap", "--top-ports", "1000", "-T4", "--open", *rate_args, host, "-oN", out_file]
+            async with sem:
+                return await self.recon.tools.run_command(cmd, timeout=300)
+
+        await asyncio.gather(*(scan_host(h) for h in top_hosts))
         
         logger.info("Port scan complete.")
         # [Future: Support Naabu for faster discovery]
@@ -21,17 +21,22 @@ class ScreenshotModule:
         
         live_list = list(self.recon.live_domains)
         chunk_size = 20
-        # Gowitness chunking logic
-        for i in range(0, len(live_list), chunk_size):
-            chunk = live_list[i:i + chunk_size]
+        # Gowitness chunking logic; a few chunks run at once, each gowitness drives its own browser
+        sem = asyncio.Semaphore(min(3, self.recon.threads))
+
+        async def capture_chunk(i: int, chunk: List[str]):
             temp_list = os.path.join(self.recon.output_dir, f"temp_ss_{i}.txt")
-            try:
-                with open(temp_list, "w") as f:
-                    for url in chunk: f.write(url + "\n")
-                
-                cmd = ["gowitness", "file", "-f", temp_list, "-P", self.recon.dirs["screenshots"], "--no-http", "--timeout", "15"]
-                await self.recon.tools.run_command(cmd, timeout=300)
-            finally:
-                if os.path.exists(temp_list): os.remove(temp_list)
+            async with sem:
+                try:
+                    with open(temp_list, "w") as f:
+                        f.write("".join(url + "\n" for url in chunk))
+
+                    cmd = ["gowitness", "file", "-f", temp_list, "-P", self.recon.dirs["screenshots"], "--no-http", "--timeout", "15"]
+                    await self.recon.tools.run_command(cmd, timeout=300)
+                finally:
+                    if os.path.exists(temp_list): os.remove(temp_list)
+
+        await asyncio.gather(*(capture_chunk(i, live_list[i:i + chunk_size])
+                               for i in range(0, len(live_list), chunk_size)))
 
         logger.info("Screenshot capture complete.")
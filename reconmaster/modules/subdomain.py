@@ -1,4 +1,5 @@
 import os
+import re
 import asyncio
 import logging
 from typing import Set
@@ -9,18 +10,27 @@ logger = logging.getLogger("ReconMaster.Subdomain")
 
 class SubdomainModule:
     """Module for passive and active subdomain discovery"""
+    # One DNS label (underscores allowed for service records)
+    HOST_LABEL = r"[a-z0-9_](?:[a-z0-9_-]{0,61}[a-z0-9_])?"
+
     def __init__(self, recon: ReconMaster):
         self.recon = recon
+        # A whole line holding the target or a host under it; compiled once per target so tool
+        # output is scanned in one finditer pass rather than a Python loop per line
+        self.scope_re = re.compile(
+            rf"^[^\S\n]*((?i:(?:{self.HOST_LABEL}\.)*){re.escape(recon.target)})[^\S\n]*$", re.MULTILINE
+        )
 
     async def passive_enum(self):
         """Passive discovery using subfinder, assetfinder, and amass"""
         logger.info(f"Starting passive enumeration for {self.recon.target}")
         
         # Files
-        subfinder_file = os.path.join(self.recon.dirs["subdomains"], "subfinder.txt")
-        assetfinder_file = os.path.join(self.recon.dirs["subdomains"], "assetfinder.txt")
-        amass_file = os.path.join(self.recon.dirs["subdomains"], "amass.txt")
-        all_passive = os.path.join(self.recon.dirs["subdomains"], "all_passive.txt")
+        files = self.recon.files
+        subfinder_file = files["subfinder"]
+        assetfinder_file = files["assetfinder"]
+        amass_file = files["amass"]
+        all_passive = files["all_passive"]
 
         # Prepare environment variables with API keys
         env = os.environ.copy()
@@ -49,18 +59,17 @@ class SubdomainModule:
         # Handle assetfinder output (it prints to stdout)
         if results[1][0]:
             with open(assetfinder_file, "w") as f:
-                filtered = [line.strip() for line in results[1][0].splitlines() if line.strip().endswith(self.recon.target)]
-                f.write("\n".join(filtered) + "\n")
+                f.write("\n".join(self._filter_in_scope(results[1][0])) + "\n")
 
         # Merge results
-        merge_and_dedupe_text_files(self.recon.dirs["subdomains"], "*.txt", all_passive)
-        
-        with open(all_passive, "r") as f:
-            for line in f:
-                self.recon.subdomains.add(line.strip())
+        self.recon.subdomains.update(merge_and_dedupe_text_files(self.recon.dirs["subdomains"], "*.txt", all_passive))
         
         logger.info(f"Passive discovery finished. Total subdomains: {len(self.recon.subdomains)}")
 
+    def _filter_in_scope(self, text: str) -> list:
+        """Keep lines naming the target itself or well-formed hosts under it"""
+        return [m.group(1) for m in self.scope_re.finditer(text)]
+
     async def active_enum(self, wordlist: str):
         """Active brute-forcing using ffuf"""
         if not os.path.exists(wordlist):
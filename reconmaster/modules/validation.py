@@ -1,8 +1,15 @@
 import os
 import json
+import asyncio
 import logging
-import shutil
 from ..core import ReconMaster
+from ..utils import write_lines, resolve_hosts
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = logging.getLogger("ReconMaster.Validation")
 
@@ -13,25 +20,38 @@ class ValidationModule:
 
     async def resolve_dns(self):
         """Resolve subdomains to IPs using dnsx"""
-        all_subs = os.path.join(self.recon.dirs["subdomains"], "all_subdomains.txt")
-        live_subs = os.path.join(self.recon.dirs["subdomains"], "live_subdomains.txt")
-        
-        # Save all subdomains to file first
-        with open(all_subs, "w") as f:
-            f.write("\n".join(sorted(self.recon.subdomains)) + "\n")
+        live_subs = self.recon.files["live_subdomains"]
+        hosts = sorted(self.recon.subdomains)
 
         if "dnsx" in self.recon.tools.tool_paths:
             logger.info("Resolving subdomains with dnsx")
-            cmd = ["dnsx", "-l", all_subs, "-silent", "-o", live_subs]
-            await self.recon.tools.run_command(cmd)
+            # Hosts go in on stdin; all_passive.txt already holds the merged list on disk
+            cmd = ["dnsx", "-silent", "-o", live_subs]
+            await self.recon.tools.run_command(cmd, input_data="".join(h + "\n" for h in hosts))
+        elif self.recon.tools.dry_run:
+            await asyncio.to_thread(write_lines, live_subs, hosts)
         else:
-            shutil.copy(all_subs, live_subs)
+            # No dnsx: drop names that don't resolve so httpx and later phases skip them
+            logger.info("dnsx not available, resolving %d subdomains in-process", len(self.recon.subdomains))
+            resolved = await resolve_hosts(hosts)
+            await asyncio.to_thread(write_lines, live_subs, resolved)
 
     async def probe_http(self):
         """Probe for live web services using httpx"""
-        live_subs = os.path.join(self.recon.dirs["subdomains"], "live_subdomains.txt")
-        httpx_out = os.path.join(self.recon.dirs["http"], "httpx_results.json")
-        alive_txt = os.path.join(self.recon.dirs["http"], "alive.txt")
+        live_subs = self.recon.files["live_subdomains"]
+        httpx_out = self.recon.files["httpx_results"]
+        alive_txt = self.recon.files["alive"]
+
+        if "httpx" not in self.recon.tools.tool_paths:
+            # No httpx binary: probe in-process over the shared keep-alive session
+            hosts = self._probe_targets(live_subs)
+            if self.recon.tools.dry_run:
+                print(f"[DRY-RUN] Would probe {len(hosts)} hosts in-process")
+            else:
+                await self._probe_native(hosts)
+            await asyncio.to_thread(write_lines, alive_txt, sorted(self.recon.live_domains))
+            logger.info(f"Validation finished. Found {len(self.recon.live_domains)} live hosts.")
+            return
 
         cmd = [
             "httpx", "-l", live_subs, "-json", "-o", httpx_out,
@@ -40,17 +60,48 @@ class ValidationModule:
         await self.recon.tools.run_command(cmd, timeout=600)
 
         if os.path.exists(httpx_out):
-            with open(httpx_out, "r") as f:
+            with open(httpx_out, "rb") as f:
                 for line in f:
                     try:
-                        data = json.loads(line)
+                        data = _json_loads(line)
                         url = data.get("url")
                         if url:
                             self.recon.live_domains.add(url)
                             self.recon.tech_stack[url] = data.get("tech", [])
                     except: continue
 
-            with open(alive_txt, "w") as f:
-                f.write("\n".join(sorted(self.recon.live_domains)) + "\n")
+            await asyncio.to_thread(write_lines, alive_txt, sorted(self.recon.live_domains))
         
         logger.info(f"Validation finished. Found {len(self.recon.live_domains)} live hosts.")
+
+
+    def _probe_targets(self, live_subs: str) -> list:
+        """Resolved hosts from live_subs, or every subdomain if resolution left nothing behind"""
+        if os.path.exists(live_subs):
+            with open(live_subs, "r") as f:
+                hosts = [line.strip() for line in f if line.strip()]
+            if hosts:
+                return hosts
+        return sorted(self.recon.subdomains)
+
+    async def _probe_native(self, hosts: list):
+        """Probe hosts with aiohttp, https first then http (no tech detection)"""
+        if not hosts:
+            return
+
+        logger.info(f"httpx not available, probing {len(hosts)} hosts in-process")
+        session = await self.recon.http.get_session()
+        sem = asyncio.Semaphore(self.recon.threads)
+
+        async def probe(host):
+            async with sem:
+                for scheme in ("https", "http"):
+                    url = f"{scheme}://{host}"
+                    try:
+                        async with session.head(url, allow_redirects=True, timeout=10):
+                            self.recon.live_domains.add(url)
+                            return
+                    except Exception:
+                        continue
+
+        await asyncio.gather(*(probe(h) for h in hosts))
@@ -109,6 +109,5 @@ class VulnerabilityModule:
         
         if broken:
             with open(self.recon.files["broken_links"], "w") as f:
-                for link in broken:
-                    f.write(link + "\n")
-                    self.recon.vulns.append({"info": {"name": "Broken Social Link Hijack", "severity": "medium"}, "matched-at": link})
+                f.write("".join(link + "\n" for link in broken))
+            self.recon.vulns.extend({"info": {"name": "Broken Social Link Hijack", "severity": "medium"}, "matched-at": link} for link in broken)
@@ -1,4 +1,5 @@
 from datetime import datetime
+import html
 import json
 import re
 
@@ -6,13 +7,11 @@ def generate_premium_html_report(recon, duration: str, end_dt: datetime) -> str:
     """Generate high-fidelity premium HTML report with interactive visualizations"""
     
     # Prepare data for charts
-    severity_counts = {
-        "critical": len([v for v in recon.vulns if v.get("info", {}).get("severity") == "critical"]),
-        "high": len([v for v in recon.vulns if v.get("info", {}).get("severity") == "high"]),
-        "medium": len([v for v in recon.vulns if v.get("info", {}).get("severity") == "medium"]),
-        "low": len([v for v in recon.vulns if v.get("info", {}).get("severity") == "low"]),
-        "info": len([v for v in recon.vulns if v.get("info", {}).get("severity") == "info"]),
-    }
+    severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0, "info": 0}
+    for v in recon.vulns:
+        sev = (v.get("info") or {}).get("severity")
+        if sev in severity_counts:
+            severity_counts[sev] += 1
 
     # Calculate technology distribution
     tech_dist = {}
@@ -23,6 +22,11 @@ def generate_premium_html_report(recon, duration: str, end_dt: datetime) -> str:
                 tech_dist[t_str] = tech_dist.get(t_str, 0) + 1
     top_techs = dict(sorted(tech_dist.items(), key=lambda x: x[1], reverse=True)[:10])
 
+    # Targets, findings and tech names come from scanned hosts; escape everything that reaches the page
+    esc = lambda value: html.escape(str(value), quote=True)
+    # "</" would close the <script> block early, so it is escaped inside the JSON as well
+    js = lambda value: json.dumps(value).replace("</", "<\\/")
+
     def _calculate_risk_score() -> int:
         score = 0
         severity_map = {"critical": 30, "high": 15, "medium": 5, "low": 1}
@@ -51,7 +55,7 @@ def generate_premium_html_report(recon, duration: str, end_dt: datetime) -> str:
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Titan Dashboard 2.0 - {recon.target}</title>
+    <title>Titan Dashboard 2.0 - {esc(recon.target)}</title>
     <link href="https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;600;700&family=JetBrains+Mono&display=swap" rel="stylesheet">
     <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
     <style>
@@ -102,8 +106,8 @@ def generate_premium_html_report(recon, duration: str, end_dt: datetime) -> str:
     </sidebar>
     <main>
         <div class="header">
-            <h1>{recon.target}</h1>
-            <p>Assessment Duration: {duration} | Date: {end_dt.strftime("%Y-%m-%d %H:%M:%S")}</p>
+            <h1>{esc(recon.target)}</h1>
+            <p>Assessment Duration: {esc(duration)} | Date: {end_dt.strftime("%Y-%m-%d %H:%M:%S")}</p>
         </div>
         <div class="stats-grid">
             <div class="stat-card">
@@ -123,10 +127,10 @@ def generate_premium_html_report(recon, duration: str, end_dt: datetime) -> str:
             <h2>Findings</h2>
             {"".join([f'''
             <div class="finding-item">
-                <span class="severity-pill bg-{v.get('info', {}).get('severity', 'info').lower()}">{v.get('info', {}).get('severity', 'info')}</span>
-                <strong>{v.get('info', {}).get('name', 'Finding')}</strong>
-                <p>{v.get('matched-at', 'N/A')}</p>
-                <div style="font-size: 0.85rem; color: var(--text-dim);">{_generate_ai_profile(v)}</div>
+                <span class="severity-pill bg-{esc(v.get('info', {}).get('severity', 'info').lower())}">{esc(v.get('info', {}).get('severity', 'info'))}</span>
+                <strong>{esc(v.get('info', {}).get('name', 'Finding'))}</strong>
+                <p>{esc(v.get('matched-at', 'N/A'))}</p>
+                <div style="font-size: 0.85rem; color: var(--text-dim);">{esc(_generate_ai_profile(v))}</div>
             </div>
             ''' for v in recon.vulns]) if recon.vulns else "<p>No findings.</p>"}
         </section>
@@ -149,10 +153,10 @@ def generate_premium_html_report(recon, duration: str, end_dt: datetime) -> str:
         new Chart(techCtx, {{
             type: 'bar',
             data: {{
-                labels: {list(top_techs.keys())},
+                labels: {js(list(top_techs.keys()))},
                 datasets: [{{
                     label: 'Count',
-                    data: {list(top_techs.values())},
+                    data: {js(list(top_techs.values()))},
                     backgroundColor: '#38bdf8'
                 }}]
             }},
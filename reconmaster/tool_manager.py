@@ -4,12 +4,15 @@ import asyncio
 import logging
 import random
 from typing import List, Tuple, Dict, Optional
-from .utils import safe_run
+from .utils import async_run
 
 logger = logging.getLogger("ReconMaster.Tool")
 
 class ToolManager:
     """Manager for external tool discovery and secure execution"""
+    # Web-facing tools that get a randomized User-Agent header
+    UA_TOOLS = frozenset({"httpx", "ffuf", "katana", "nuclei", "subfinder", "amass"})
+
     def __init__(self, user_agents: List[str]):
         self.tool_paths: Dict[str, str] = {}
         self.user_agents = user_agents
@@ -68,11 +71,12 @@ class ToolManager:
             out = res.stdout.strip() or res.stderr.strip()
             # Grab first line as version
             version_str = out.split('\n')[0][:50]
-            logger.debug(f"{name} path: {path} | ver: {version_str}")
+            logger.debug("%s path: %s | ver: %s", name, path, version_str)
         except Exception as e:
-            logger.debug(f"Could not determine version for {name}: {e}")
+            logger.debug("Could not determine version for %s: %s", name, e)
 
-    async def run_command(self, cmd: List[str], timeout: int = 300, env: Optional[Dict[str, str]] = None) -> Tuple[str, str, int]:
+    async def run_command(self, cmd: List[str], timeout: int = 300, env: Optional[Dict[str, str]] = None,
+                          input_data: Optional[str] = None) -> Tuple[str, str, int]:
         """Execute tool commands asynchronously with security and timeout policies"""
         if not cmd:
             return "", "Empty command", -1
@@ -80,31 +84,30 @@ class ToolManager:
         tool_name = cmd[0].lower()
         processed_cmd = list(cmd)
 
-        # Resolve to absolute path
-        if tool_name in self.tool_paths:
-            processed_cmd[0] = self.tool_paths[tool_name]
+        # Resolve to absolute path (resolved once in verify_tools)
+        path = self.tool_paths.get(tool_name)
+        if path:
+            processed_cmd[0] = path
 
         # Inject User-Agent for known web-facing tools
-        UA_TOOLS = {"httpx", "ffuf", "katana", "nuclei", "subfinder", "amass"}
-        if tool_name in UA_TOOLS:
+        if tool_name in self.UA_TOOLS:
             ua = random.choice(self.user_agents)
             # Simple check to avoid double injection if the caller already added it
             if "-H" not in processed_cmd:
                  processed_cmd.extend(["-H", f"User-Agent: {ua}"])
 
-        logger.debug(f"Executing: {' '.join(processed_cmd)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing: %s", " ".join(processed_cmd))
 
         if self.dry_run:
             print(f"[DRY-RUN] Would execute: {' '.join(processed_cmd)}")
             return "", "Dry Run", 0
 
         try:
-            async with asyncio.timeout(timeout + 5):
-                loop = asyncio.get_running_loop()
-                async with self.semaphore:
-                    stdout, stderr, rc = await loop.run_in_executor(
-                        None, safe_run, processed_cmd, timeout, env or os.environ.copy()
-                    )
+            # Queue for a slot first so waiting behind other tools doesn't eat into this one's timeout
+            async with self.semaphore:
+                async with asyncio.timeout(timeout + 5):
+                    stdout, stderr, rc = await async_run(processed_cmd, timeout, env, input_data)
             return stdout, stderr, rc
         except asyncio.TimeoutError:
             logger.error(f"Command timed out: {' '.join(processed_cmd)}")
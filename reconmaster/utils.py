@@ -1,32 +1,53 @@
 import subprocess
+import asyncio
 import os
 import sys
+import signal
 import glob
 import shlex
 import shutil
-from typing import List, Optional
+import functools
+from typing import Iterable, List, Optional
 
+# aiodns resolves over c-ares on the event loop; without it getaddrinfo runs in the default executor
+try:
+    import aiodns
+    _HAVE_AIODNS = True
+except ImportError:
+    _HAVE_AIODNS = False
 
-def safe_run(cmd, timeout: Optional[int] = None, env: Optional[dict] = None):
-    """Run a command safely with robust group-level timeout termination.
 
-    cmd can be a list (preferred) or a string. Returns (stdout, stderr, returncode).
-    """
+@functools.lru_cache(maxsize=None)
+def _which(exe: str, path: str) -> Optional[str]:
+    """shutil.which, memoized per (executable, PATH) so repeat calls skip the PATH walk"""
+    return shutil.which(exe, path=path)
+
+
+def _tool_env(env: Optional[dict] = None) -> dict:
+    """System environment merged with env, with the bundled bin/ directory first on PATH"""
     local_bin = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bin")
-    if env is None:
-        env = os.environ.copy()
-    else:
-        # Merge passed env with system env for PATH consistency
-        base_env = os.environ.copy()
-        base_env.update(env)
-        env = base_env
+    # Merge passed env with system env for PATH consistency
+    merged = os.environ.copy()
+    if env:
+        merged.update(env)
 
     if os.path.exists(local_bin):
-        env["PATH"] = local_bin + os.pathsep + env.get("PATH", "")
+        merged["PATH"] = local_bin + os.pathsep + merged.get("PATH", "")
+    return merged
+
+
+def safe_run(cmd, timeout: Optional[int] = None, env: Optional[dict] = None, input_data: Optional[str] = None):
+    """Run a command safely with robust group-level timeout termination.
+
+    cmd can be a list (preferred) or a string. input_data, if given, is written to the
+    command's stdin. Returns (stdout, stderr, returncode).
+    """
+    env = _tool_env(env)
 
     if isinstance(cmd, list):
         exe = cmd[0]
-        full_path = shutil.which(exe, path=env["PATH"])
+        # Callers pass tool_paths-resolved absolute paths; only bare names need a PATH search
+        full_path = exe if os.path.isabs(exe) else _which(exe, env["PATH"])
         if full_path:
             cmd[0] = full_path
         cmd_list = [str(c) for c in cmd]
@@ -35,24 +56,117 @@ def safe_run(cmd, timeout: Optional[int] = None, env: Optional[dict] = None):
             parts = shlex.split(cmd)
             if parts:
                 exe = parts[0]
-                full_path = shutil.which(exe, path=env["PATH"])
+                full_path = _which(exe, env["PATH"])
                 if full_path:
                     parts[0] = full_path
                 cmd_list = parts
             else:
                 cmd_list = []
         except Exception:
-            return _run_in_shell(cmd, timeout, env)
+            return _run_in_shell(cmd, timeout, env, input_data)
+
+    return _execute_with_timeout(cmd_list, False, timeout, env, input_data)
 
-    return _execute_with_timeout(cmd_list, False, timeout, env)
+async def _drain(stream, chunks: List[bytes]):
+    """Append everything read from stream to chunks until EOF"""
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            return
+        chunks.append(chunk)
+
+
+async def _feed(stdin, data: bytes):
+    """Write data to the child's stdin and close it; a child that exits early is not an error"""
+    try:
+        stdin.write(data)
+        await stdin.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        pass
+    finally:
+        stdin.close()
+
+
+def _kill_tree(proc):
+    """Kill proc and everything in its process group; an already-reaped process is not an error"""
+    try:
+        if sys.platform == "win32":
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+                           capture_output=True, check=False)
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+async def async_run(cmd: List[str], timeout: Optional[int] = None, env: Optional[dict] = None,
+                    input_data: Optional[str] = None):
+    """Asyncio counterpart of safe_run for list commands.
+
+    The event loop drains the pipes, so no thread is parked per running tool. On timeout the
+    whole process group is killed, as in safe_run, and whatever the tool wrote before that is
+    still returned. If the caller is cancelled the group is killed as well before the
+    cancellation propagates. Returns (stdout, stderr, returncode).
+    """
+    env = _tool_env(env)
+    exe = cmd[0]
+    full_path = exe if os.path.isabs(exe) else _which(exe, env["PATH"])
+    cmd_list = [str(c) for c in cmd]
+    if full_path:
+        cmd_list[0] = full_path
 
-def _run_in_shell(cmd, timeout, env):
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd_list,
+            stdin=asyncio.subprocess.PIPE if input_data is not None else None,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+            start_new_session=sys.platform != "win32"
+        )
+    except Exception as e:
+        return "", str(e), 1
+
+    # Output is collected chunk by chunk rather than via communicate(), so a timeout keeps it
+    out_chunks: List[bytes] = []
+    err_chunks: List[bytes] = []
+    io_tasks = [_drain(proc.stdout, out_chunks), _drain(proc.stderr, err_chunks)]
+    if input_data is not None:
+        io_tasks.append(_feed(proc.stdin, input_data.encode("utf-8")))
+
+    io = asyncio.gather(*io_tasks)
+    try:
+        await asyncio.wait_for(io, timeout)
+        await proc.wait()
+    except asyncio.TimeoutError:
+        _kill_tree(proc)
+        # Pick up what was still buffered in the pipes; bounded in case something outside the group holds them
+        try:
+            await asyncio.wait_for(asyncio.gather(_drain(proc.stdout, out_chunks),
+                                                  _drain(proc.stderr, err_chunks)), 2)
+        except asyncio.TimeoutError:
+            pass
+        await proc.wait()
+        err = b"".join(err_chunks)
+        return (b"".join(out_chunks).decode("utf-8", "replace"),
+                err.decode("utf-8", "replace") if err else f"Timeout after {timeout}s", 1)
+    except BaseException:
+        # Cancelled (outer timeout, a failing gather sibling, Ctrl-C): don't leave the tool running
+        _kill_tree(proc)
+        io.cancel()
+        io.add_done_callback(lambda f: f.cancelled() or f.exception())
+        await proc.wait()
+        raise
+    return (b"".join(out_chunks).decode("utf-8", "replace"),
+            b"".join(err_chunks).decode("utf-8", "replace"), proc.returncode)
+
+def _run_in_shell(cmd, timeout, env, input_data=None):
     """Helper for shell=True fallback with timeout termination"""
     if isinstance(cmd, list):
         cmd = " ".join([f'"{c}"' if " " in c else c for c in cmd])
-    return _execute_with_timeout(cmd, True, timeout, env)
+    return _execute_with_timeout(cmd, True, timeout, env, input_data)
 
-def _execute_with_timeout(cmd, shell, timeout, env):
+def _execute_with_timeout(cmd, shell, timeout, env, input_data=None):
     """Execute a command and ensure it and all children are killed on timeout"""
     import subprocess
     import signal
@@ -67,14 +181,17 @@ def _execute_with_timeout(cmd, shell, timeout, env):
         "env": env,
         "shell": shell
     }
+    if input_data is not None:
+        kwargs["stdin"] = subprocess.PIPE
     
     if sys.platform != "win32":
-        kwargs["preexec_fn"] = os.setsid
+        # Same setsid() as preexec_fn=os.setsid, but keeps Popen on the vfork/posix_spawn path
+        kwargs["start_new_session"] = True
 
     try:
         proc = subprocess.Popen(cmd, **kwargs)
         try:
-            stdout, stderr = proc.communicate(timeout=timeout)
+            stdout, stderr = proc.communicate(input=input_data, timeout=timeout)
             return stdout, stderr, proc.returncode
         except subprocess.TimeoutExpired:
             if sys.platform == "win32":
@@ -91,10 +208,11 @@ def _execute_with_timeout(cmd, shell, timeout, env):
         return "", str(e), 1
 
 
-def merge_and_dedupe_text_files(input_dir: str, pattern: str, output_file: str):
+def merge_and_dedupe_text_files(input_dir: str, pattern: str, output_file: str) -> List[str]:
     """Merge all text files matching pattern (relative to input_dir) into output_file, unique sorted lines.
 
     pattern should be a glob pattern like "*.txt" or "*.json". This avoids shell-only utilities.
+    Returns the merged lines so callers need not read output_file back.
     """
     paths = glob.glob(os.path.join(input_dir, pattern))
     lines = set()
@@ -111,8 +229,49 @@ def merge_and_dedupe_text_files(input_dir: str, pattern: str, output_file: str):
     sorted_lines = sorted(lines)
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
     with open(output_file, "w", encoding="utf-8") as out:
-        for line in sorted_lines:
-            out.write(line + "\n")
+        out.write("".join(line + "\n" for line in sorted_lines))
+    return sorted_lines
+
+
+def write_lines(path: str, lines: List[str]):
+    """Write lines to path, newline-terminated, in a single write call.
+
+    Blocking; async callers should run it via asyncio.to_thread so large lists don't stall the loop.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+async def resolve_hosts(hosts: Iterable[str], concurrency: int = 256) -> List[str]:
+    """Return the hosts that resolve in DNS, looked up concurrently.
+
+    Used to drop dead subdomains before they are handed to httpx when dnsx is not installed.
+    """
+    sem = asyncio.Semaphore(concurrency)
+    if _HAVE_AIODNS:
+        resolver = aiodns.DNSResolver()
+
+        async def lookup(host):
+            async with sem:
+                for qtype in ("A", "AAAA"):
+                    try:
+                        await resolver.query(host, qtype)
+                        return host
+                    except Exception:
+                        continue
+                return None
+    else:
+        loop = asyncio.get_running_loop()
+
+        async def lookup(host):
+            async with sem:
+                try:
+                    await loop.getaddrinfo(host, None)
+                    return host
+                except Exception:
+                    return None
+
+    return [h for h in await asyncio.gather(*(lookup(h) for h in hosts)) if h]
 
 
 def find_wordlist(preferred_paths: List[str]) -> Optional[str]:
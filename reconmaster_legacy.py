@@ -14,6 +14,8 @@ GITHUB = "https://github.com/VIPHACKER100/ReconMaster"
 import os
 import sys
 import argparse
+import html
+import io
 import json
 import time
 import asyncio
@@ -22,7 +24,10 @@ import re
 import shutil
 import random
 import concurrent.futures
+import functools
+import hashlib
 import subprocess
+import importlib.metadata
 from datetime import datetime
 from pathlib import Path
 from typing import List, Set, Dict, Any, Optional, Tuple, Union
@@ -35,10 +40,77 @@ except ImportError:
     aiohttp = None
     _HAVE_AIOHTTP = False
 
+# orjson parses and emits tool/state JSON several times faster than the stdlib
+try:
+    import orjson
+    _HAVE_ORJSON = True
+    _json_loads = orjson.loads
+except ImportError:
+    _HAVE_ORJSON = False
+    _json_loads = json.loads
+
+
+# uvloop is a faster drop-in event loop on Linux/macOS; Windows keeps the stdlib loop
+try:
+    import uvloop
+    _HAVE_UVLOOP = True
+except ImportError:
+    _HAVE_UVLOOP = False
+
+# ijson streams large tool result arrays instead of materializing the whole document
+try:
+    import ijson
+    _HAVE_IJSON = True
+except ImportError:
+    _HAVE_IJSON = False
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON bytes, using orjson when available"""
+    if _HAVE_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _write_json_atomic(path: str, obj: Any):
+    """Write obj as JSON in one write to a temp file, then swap it into place"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_json_dumps(obj))
+    os.replace(tmp_path, path)
+
 # Global HTTP Configuration (Lazy initialization recommended for connectors)
 HTTP_TIMEOUT = aiohttp.ClientTimeout(total=20) if _HAVE_AIOHTTP else None
 
-from utils import safe_run, merge_and_dedupe_text_files, find_wordlist
+# Characters stripped from header values before they reach tool argv (one str.translate pass)
+_HEADER_UNSAFE = str.maketrans("", "", ";&|$`()<>\n\r\"'")
+
+# Web-facing tools that get a randomized User-Agent header
+_UA_TOOLS = frozenset({"httpx", "ffuf", "katana", "nuclei", "subfinder", "amass"})
+
+# HTTP statuses that signal throttling/blocking and feed the circuit breaker
+_THROTTLE_STATUSES = frozenset({403, 429, 503})
+
+_JS_NAME_UNSAFE = re.compile(r'[^a-zA-Z0-9]')
+
+# Secret and endpoint patterns applied to every downloaded JS file, compiled once
+_JS_PATTERNS = {
+    "google_api": re.compile(r"AIza[0-9A-Za-z-_]{35}"),
+    "amazon_aws_key": re.compile(r"AKIA[0-9A-Z]{16}"),
+    "github_access_token": re.compile(r"[a-zA-Z0-9_-]*:[a-zA-Z0-9_\-]+@github\.com"),
+    "slack_token": re.compile(r"xox[baprs]-[0-9a-zA-Z]{10,48}"),
+    "mailgun_api_key": re.compile(r"key-[0-9a-zA-Z]{32}"),
+    "stripe_api_key": re.compile(r"sk_live_[0-9a-zA-Z]{24}"),
+    "endpoint": re.compile(r"(?:https?://|/)[a-zA-Z0-9.\-_/]+(?:\?[a-zA-Z0-9.\-_=&]+)?")
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _js_analysis_name(js_url: str) -> str:
+    """Filesystem-safe stem for a JS file's analysis output, memoized per URL"""
+    return _JS_NAME_UNSAFE.sub('_', js_url.split('/')[-1])[:50]
+
+from utils import merge_and_dedupe_text_files, find_wordlist, resolve_hosts, async_run
 
 class CircuitBreaker:
     """Unified circuit breaker for all HTTP operations to prevent rate limiting and saturation"""
@@ -48,47 +120,47 @@ class CircuitBreaker:
         self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
         self.open_time = 0.0
         self.timeout = timeout
-        self.lock = asyncio.Lock()
+        # No lock. This is only safe because every method below reads and updates state with no
+        # await in between, so on the single event loop thread no other coroutine can run in the
+        # middle of a transition. Adding an await inside one of them (e.g. to log or notify
+        # asynchronously) reintroduces the race; put the asyncio.Lock back if that is ever needed.
     
     async def record_error(self, status_code: int):
         """Record failed request and potentially open the circuit"""
-        async with self.lock:
-            if status_code in [403, 429, 503]:
-                self.error_count += 1
-                logger.warning(f"Circuit breaker alert: {self.error_count}/{self.threshold} errors recorded.")
-                
-                if self.error_count >= self.threshold and self.state == "CLOSED":
-                    self.state = "OPEN"
-                    self.open_time = time.time()
-                    logger.error(f"🚫 CIRCUIT BREAKER OPENED - Rate limiting detected. Cooling down for {self.timeout}s.")
+        if status_code in _THROTTLE_STATUSES:
+            self.error_count += 1
+            logger.warning("Circuit breaker alert: %d/%d errors recorded.", self.error_count, self.threshold)
+
+            if self.error_count >= self.threshold and self.state == "CLOSED":
+                self.state = "OPEN"
+                self.open_time = time.monotonic()
+                logger.error(f"🚫 CIRCUIT BREAKER OPENED - Rate limiting detected. Cooling down for {self.timeout}s.")
                 
     async def record_success(self):
         """Record successful request and recovery"""
-        async with self.lock:
-            if self.error_count > 0:
-                self.error_count = max(0, self.error_count - 1)
-            
-            if self.state == "HALF_OPEN":
-                self.state = "CLOSED"
-                logger.info("✅ Circuit breaker CLOSED - System recovered.")
+        if self.error_count > 0:
+            self.error_count -= 1
+
+        if self.state == "HALF_OPEN":
+            self.state = "CLOSED"
+            logger.info("✅ Circuit breaker CLOSED - System recovered.")
     
     async def check_can_proceed(self) -> bool:
         """Check if requests can proceed based on current state"""
-        async with self.lock:
-            if self.state == "CLOSED":
-                return True
-            
-            if self.state == "OPEN":
-                elapsed = time.time() - self.open_time
-                if elapsed > self.timeout:
-                    self.state = "HALF_OPEN"
-                    logger.info("🔌 Circuit breaker Entering HALF_OPEN - testing connectivity.")
-                    return True
-                return False
-            
-            # HALF_OPEN - allow requests but monitor closely
+        if self.state == "CLOSED":
             return True
 
+        if self.state == "OPEN":
+            elapsed = time.monotonic() - self.open_time
+            if elapsed > self.timeout:
+                self.state = "HALF_OPEN"
+                logger.info("🔌 Circuit breaker Entering HALF_OPEN - testing connectivity.")
+                return True
+            return False
+
+        # HALF_OPEN - allow requests but monitor closely
+        return True
+
 class SensitiveFilter(logging.Filter):
     """Filter sensitive data (keys, tokens, passwords) from all log outputs"""
     PATTERNS = [
@@ -103,12 +175,14 @@ class SensitiveFilter(logging.Filter):
         (r'wf256DDVZSsJHUtpSAs3pX-yQsKWACSM', '[REDACTED_SECURITYTRAILS_KEY]'),
         (r'4305df5d2d95222bca49a37e7298208e85fb7c5afe8d1ae1ff6f6f241733fb98', '[REDACTED_VIRUSTOTAL_KEY]'),
     ]
+    # Compiled once at class load; filter() runs on every log record
+    COMPILED_PATTERNS = [(re.compile(p, re.IGNORECASE), r) for p, r in PATTERNS]
     
     def filter(self, record):
         if hasattr(record, 'msg'):
             msg = str(record.msg)
-            for pattern, replacement in self.PATTERNS:
-                msg = re.sub(pattern, replacement, msg, flags=re.IGNORECASE)
+            for pattern, replacement in self.COMPILED_PATTERNS:
+                msg = pattern.sub(replacement, msg)
             record.msg = msg
         return True
 
@@ -170,12 +244,28 @@ class ReconMaster:
     MAX_FILE_SIZE_MB = 5
     CIRCUIT_BREAKER_THRESHOLD = 10
     CIRCUIT_BREAKER_COOLDOWN = 60
+    ADMIN_KEYWORDS = ("admin", "login", "wp-admin", "dashboard", "control", "panel", "auth")
+    FFUF_DIR_MATCH_CODES = "200,201,204,301,302,401,403"
+    CACHE_TTL = 24 * 3600  # Seconds an opted-in ffuf/arjun cache entry stays valid
+    API_INTEREST_STATUSES = frozenset({200, 201, 401, 403})  # Interested in access or restricted
+
+    # --- Target Validation Patterns ---
+    DOMAIN_CHARS_RE = re.compile(r'^[a-zA-Z0-9.-]+$')
+    FQDN_RE = re.compile(r"(?:[a-zA-Z0-9-]+\.)+[a-zA-Z]{2,}")
+    PRIVATE_TARGET_RE = re.compile(
+        r'^(?:localhost|127\.|192\.168\.|10\.|172\.(?:1[6-9]|2[0-9]|3[0-1])\.|.*\.local$|.*\.internal$)',
+        re.IGNORECASE
+    )
 
     def __init__(self, target: str, output_dir: str, threads: int = 10, wordlist: Optional[str] = None):
         self.target = target
         self.validate_target() # Sanitize and validate before path creation
         self.timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         self.output_dir = os.path.join(output_dir, f"{self.target}_{self.timestamp}")
+        # Shared across timestamped runs so unchanged targets can reuse tool results (opt-in, --cache)
+        self.cache_dir = os.path.join(output_dir, ".cache")
+        self.use_cache = False
+        self._tool_versions: Dict[str, str] = {}
         self.threads = threads
         self.subdomains: Set[str] = set()
         self.live_domains: Set[str] = set()
@@ -185,6 +275,8 @@ class ReconMaster:
         self.vulns: List[Dict[str, Any]] = []
         self.tech_stack: Dict[str, List[str]] = {}
         self.broken_links: List[str] = []
+        # Sorted live-host order shared by the sampled per-host phases, see _host_sample()
+        self._host_plan: List[str] = []
 
         # Wordlist configuration
         base_path = os.path.dirname(os.path.abspath(__file__))
@@ -200,6 +292,8 @@ class ReconMaster:
         self.resume = False
         self.daily = False
         self.dry_run = False
+        self.rate_limit: Optional[int] = None  # scan.rate_limit, requests/sec enforced inside the tools
+        self.max_concurrent = 128  # scan.max_concurrent, scan-wide cap on in-flight HTTP requests
         self.tool_paths = {}
         self.dir_wordlist = os.path.join(base_path, "wordlists", "directory-list.txt")
         self.php_wordlist = os.path.join(base_path, "wordlists", "php_fuzz.txt")
@@ -233,6 +327,7 @@ class ReconMaster:
 
         # Initialize semaphore for concurrency control
         self.semaphore = asyncio.Semaphore(self.threads)
+        self._session = None  # Scan-wide aiohttp session, see _get_session()
         self.ffuf_semaphore = asyncio.Semaphore(5)  # Limit parallel ffuf chunks
         self.screenshot_semaphore = asyncio.Semaphore(3)  # Limit parallel screenshots
         self.circuit_breaker = CircuitBreaker(threshold=self.CIRCUIT_BREAKER_THRESHOLD, timeout=self.CIRCUIT_BREAKER_COOLDOWN)
@@ -252,6 +347,19 @@ class ReconMaster:
         if directory:
             os.makedirs(directory, exist_ok=True)
 
+    async def _get_session(self):
+        """Return the scan-wide aiohttp session so concurrent phases share one keep-alive pool"""
+        if self._session is None or self._session.closed:
+            # The connector limit is the one global bound for every HTTP phase; per-host stays at 30
+            connector = aiohttp.TCPConnector(ssl=False, limit=self.max_concurrent, limit_per_host=30, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(timeout=HTTP_TIMEOUT, connector=connector)
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
     def load_config(self, config_file: Optional[str] = None):
         """Load configuration from YAML file and apply to current instance"""
         if not config_file:
@@ -271,6 +379,8 @@ class ReconMaster:
             # Apply scan settings
             scan_cfg = config.get('scan', {})
             self.threads = scan_cfg.get('threads', self.threads)
+            self.rate_limit = scan_cfg.get('rate_limit', self.rate_limit)
+            self.max_concurrent = scan_cfg.get('max_concurrent', self.max_concurrent)
             
             # Apply notification settings
             notif_cfg = config.get('notifications', {})
@@ -297,11 +407,7 @@ class ReconMaster:
 
     def _sanitize_header_value(self, value: str) -> str:
         """Sanitize header values to prevent multi-line or shell injection in potential log/shell scenarios"""
-        dangerous = [';', '&', '|', '$', '`', '(', ')', '<', '>', '\n', '\r', '"', "'"]
-        sanitized = value
-        for char in dangerous:
-            sanitized = sanitized.replace(char, '')
-        return sanitized
+        return value.translate(_HEADER_UNSAFE)
 
     def _safe_path(self, directory_key: str, filename: str) -> str:
         """Safely construct file path and strictly prevent path traversal"""
@@ -320,6 +426,73 @@ class ReconMaster:
         
         return str(target_path)
 
+    def _host_sample(self, limit: int) -> List[str]:
+        """First `limit` live hosts from one deterministic ordering shared by all sampled phases.
+
+        Slicing list(set) gave each phase (and each run) an arbitrary subset; a common sorted
+        plan makes the phases overlap on the same hosts and keeps tool cache keys stable.
+        live_domains only ever grows, so a size change is enough to detect a stale plan.
+        """
+        if len(self._host_plan) != len(self.live_domains):
+            self._host_plan = sorted(self.live_domains)
+        return self._host_plan[:limit]
+
+    def _tool_version(self, tool: str) -> str:
+        """Installed version of a tool, memoized per run; empty if it cannot be determined"""
+        if tool not in self._tool_versions:
+            version = ""
+            try:
+                # Python tools such as arjun report their version through package metadata
+                version = importlib.metadata.version(tool)
+            except importlib.metadata.PackageNotFoundError:
+                path = self.tool_paths.get(tool)
+                if path:
+                    try:
+                        res = subprocess.run([path, "-V"], capture_output=True, text=True, timeout=5)
+                        version = (res.stdout.strip() or res.stderr.strip()).split("\n")[0][:100]
+                    except (OSError, subprocess.SubprocessError):
+                        pass
+            self._tool_versions[tool] = version
+        return self._tool_versions[tool]
+
+    def _cache_file(self, tool: str, targets: List[str], wordlist: Optional[str] = None,
+                    options: Optional[List[str]] = None) -> Optional[str]:
+        """Cache path for a tool run, keyed on tool version, result-shaping options, targets and wordlist path/mtime"""
+        if not self.use_cache:
+            return None
+        h = hashlib.sha1(f"{self.tool_paths.get(tool, tool)}\0{self._tool_version(tool)}".encode())
+        for opt in options or []:
+            h.update(b"\1" + opt.encode())
+        for t in sorted(targets):
+            h.update(b"\0" + t.encode())
+        if wordlist and os.path.exists(wordlist):
+            h.update(f"\0{wordlist}\0{os.stat(wordlist).st_mtime_ns}".encode())
+        return os.path.join(self.cache_dir, f"{tool}_{h.hexdigest()}.json")
+
+    def _cache_load(self, cache_file: Optional[str]) -> Optional[Any]:
+        """Return cached tool results, or None on miss/expired/corrupt entry"""
+        if not cache_file:
+            return None
+        try:
+            # Expired entries are ignored so repeat and monitoring scans see current results
+            if time.time() - os.path.getmtime(cache_file) > self.CACHE_TTL:
+                return None
+            with open(cache_file, "rb") as f:
+                return _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _cache_store(self, cache_file: Optional[str], data: Any):
+        """Persist parsed tool results for the next run"""
+        if not cache_file or self.dry_run:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(cache_file, "wb") as f:
+                f.write(_json_dumps(data))
+        except OSError as e:
+            logger.debug("Could not write cache %s: %s", cache_file, e)
+
     def _setup_logging(self):
         """Configure file handlers for the logger"""
         log_format = logging.Formatter('%(asctime)s [%(levelname)s] %(message)s')
@@ -372,22 +545,17 @@ class ReconMaster:
             raise ValueError(f"Domain too long: {len(self.target)} characters (max 253)")
             
         # Check for invalid characters
-        if not re.match(r'^[a-zA-Z0-9.-]+$', self.target):
+        if not self.DOMAIN_CHARS_RE.match(self.target):
             raise ValueError(f"Invalid characters in domain: {self.target}")
             
         # Validate FQDN format
-        if not re.fullmatch(r"(?:[a-zA-Z0-9-]+\.)+[a-zA-Z]{2,}", self.target):
+        if not self.FQDN_RE.fullmatch(self.target):
             raise ValueError(f"Invalid domain format: '{self.target}'. Please provide a valid FQDN (e.g., example.com).")
 
         # Security: Prevent scanning of private infrastructure
-        private_patterns = [
-            r'^localhost', r'^127\.', r'^192\.168\.', r'^10\.', 
-            r'^172\.(1[6-9]|2[0-9]|3[0-1])\.', r'.*\.local$', r'.*\.internal$'
-        ]
-        for pattern in private_patterns:
-            if re.match(pattern, self.target, re.IGNORECASE):
-                logger.error(f"🛑 Security Block: Attempted scan of private/localhost target: {self.target}")
-                raise ValueError(f"Security Restriction: Cannot scan localhost or private infrastructure: {self.target}")
+        if self.PRIVATE_TARGET_RE.match(self.target):
+            logger.error(f"🛑 Security Block: Attempted scan of private/localhost target: {self.target}")
+            raise ValueError(f"Security Restriction: Cannot scan localhost or private infrastructure: {self.target}")
 
         logger.info(f"✅ Target validated: {self.target}")
 
@@ -444,8 +612,14 @@ class ReconMaster:
             "nmap": os.path.join(self.output_dir, "nmap") # Legacy support
         }
 
-        for d in self.dirs.values():
-            os.makedirs(d, exist_ok=True)
+        # Parents precede children in self.dirs: one makedirs for the base, then a bare mkdir each
+        os.makedirs(self.dirs["base"], exist_ok=True)
+        for d in list(self.dirs.values())[1:]:
+            try:
+                os.mkdir(d)
+            except FileExistsError:
+                if not os.path.isdir(d):
+                    raise
 
         # Map logical file keys to paths
         self.files = {
@@ -494,7 +668,7 @@ class ReconMaster:
         }
         logger.info(f"Initialized project structure at {self.output_dir}")
 
-    async def _run_command(self, cmd: List[str], timeout: int = 300) -> Tuple[str, str, int]:
+    async def _run_command(self, cmd: List[str], timeout: int = 300, input_data: Optional[str] = None) -> Tuple[str, str, int]:
         """Execute command asynchronously with robust security and timeout policy"""
         raw_ua = random.choice(self.user_agents)
         ua = self._sanitize_header_value(raw_ua)
@@ -502,12 +676,12 @@ class ReconMaster:
         tool_name = processed_cmd[0].lower()
 
         # Use absolute path if we resolved it earlier
-        if tool_name in self.tool_paths:
-            processed_cmd[0] = self.tool_paths[tool_name]
+        path = self.tool_paths.get(tool_name)
+        if path:
+            processed_cmd[0] = path
 
         # Consistent UA injection policy
-        UA_TOOLS = {"httpx", "ffuf", "katana", "nuclei", "subfinder", "amass"}
-        if tool_name in UA_TOOLS:
+        if tool_name in _UA_TOOLS:
             header_flag = "-H"
             # Prevent duplicate User-Agent injection
             has_ua = any(isinstance(arg, str) and "user-agent" in arg.lower() for arg in processed_cmd)
@@ -534,20 +708,18 @@ class ReconMaster:
             env["VIRUSTOTAL_API_KEY"] = self.vt_key
             env["AMASS_VIRUSTOTAL_API_KEY"] = self.vt_key
             
-        logger.debug(f"Executing command: {' '.join(processed_cmd)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing command: %s", " ".join(processed_cmd))
 
         if self.dry_run:
             print(f"{Colors.YELLOW}[DRY-RUN] Would execute: {' '.join(processed_cmd)}{Colors.ENDC}")
             return "", "", 0
 
         try:
-            # Add top-level async timeout for safety
-            async with asyncio.timeout(timeout + 5):
-                loop = asyncio.get_running_loop()
-                async with self.semaphore:
-                    stdout, stderr, rc = await loop.run_in_executor(
-                        None, safe_run, processed_cmd, timeout, env
-                    )
+            # Take a slot first; the top-level safety timeout only covers the run itself, not the queue
+            async with self.semaphore:
+                async with asyncio.timeout(timeout + 5):
+                    stdout, stderr, rc = await async_run(processed_cmd, timeout, env, input_data)
             return stdout, stderr, rc
         except asyncio.TimeoutError:
             logger.error(f"Command timed out after {timeout}s: {tool_name}")
@@ -641,10 +813,8 @@ class ReconMaster:
                 filtered = [line.strip() for line in lines if line.strip().endswith(self.target)]
                 f.write("\n".join(filtered) + "\n")
 
-        # Merge and dedupe
-        merge_and_dedupe_text_files(self.dirs["subdomains"], "*.txt", all_passive)
-        with open(all_passive, "r") as f:
-            self.subdomains = set(line.strip() for line in f if line.strip())
+        # Merge and dedupe; the merged lines come back from the write pass, no need to re-read all_passive
+        self.subdomains = set(merge_and_dedupe_text_files(self.dirs["subdomains"], "*.txt", all_passive))
 
         print(f"{Colors.GREEN}[+] Passive discovery finished. Found {len(self.subdomains)} unique subdomains.{Colors.ENDC}")
 
@@ -698,9 +868,13 @@ class ReconMaster:
                 # Parse chunk results
                 if os.path.exists(ffuf_raw):
                     try:
-                        with open(ffuf_raw, "r") as f_json:
-                            data = json.load(f_json)
-                            for result in data.get("results", []):
+                        with open(ffuf_raw, "rb") as f_json:
+                            # Stream hits when ijson is available instead of decoding the whole chunk report
+                            if _HAVE_IJSON:
+                                results = ijson.items(f_json, "results.item")
+                            else:
+                                results = _json_loads(f_json.read()).get("results", [])
+                            for result in results:
                                 sub = f"{result['input']['FUZZ']}.{self.target}"
                                 if self._is_in_scope(sub):
                                     self.subdomains.add(sub)
@@ -726,8 +900,7 @@ class ReconMaster:
 
         # Save all subdomains
         with open(self.files["all_subdomains"], "w", encoding="utf-8") as f:
-            for sub in sorted(self.subdomains):
-                f.write(sub + "\n")
+            f.write("".join(sub + "\n" for sub in sorted(self.subdomains)))
 
         print(f"{Colors.GREEN}[+] Active discovery finished. Total subdomains: {len(self.subdomains)}{Colors.ENDC}")
 
@@ -753,26 +926,42 @@ class ReconMaster:
 
         print(f"{Colors.BLUE}[*] Validating subdomains with dnsx and detecting tech stacks...{Colors.ENDC}")
 
-        if not os.path.exists(self.files["all_subdomains"]):
-            # In passive-only mode, the file might not exist yet. Create it.
-            with open(self.files["all_subdomains"], "w") as f:
-                for sub in sorted(self.subdomains):
-                    f.write(sub + "\n")
+        # Hosts are piped to dnsx/httpx on stdin rather than staged in all_subdomains.txt first;
+        # target_list is only set when a tool has already written the narrowed list to disk
+        hosts = sorted(self.subdomains)
+        target_list = None
 
         # Fast DNS validation
         if "dnsx" in self.tool_paths:
-            print(f"{Colors.BLUE}[*] Resolving {len(self.subdomains)} subdomains with dnsx...{Colors.ENDC}")
-            dns_cmd = [self.tool_paths["dnsx"], "-l", self.files["all_subdomains"], "-silent", "-o", self.files["live_subdomains"], "-json", "-oe", self.files["dns_records"]]
+            print(f"{Colors.BLUE}[*] Resolving {len(hosts)} subdomains with dnsx...{Colors.ENDC}")
+            dns_cmd = [self.tool_paths["dnsx"], "-silent", "-o", self.files["live_subdomains"], "-json", "-oe", self.files["dns_records"]]
             if os.path.exists(self.resolvers):
                 dns_cmd.extend(["-r", self.resolvers])
-            await self._run_command(dns_cmd, timeout=300)
-            target_list = self.files["live_subdomains"] if os.path.exists(self.files["live_subdomains"]) and os.path.getsize(self.files["live_subdomains"]) > 0 else self.files["all_subdomains"]
-        else:
-            target_list = self.files["all_subdomains"]
+            await self._run_command(dns_cmd, timeout=300, input_data="".join(h + "\n" for h in hosts))
+            if os.path.exists(self.files["live_subdomains"]) and os.path.getsize(self.files["live_subdomains"]) > 0:
+                target_list = self.files["live_subdomains"]
+        elif not self.dry_run:
+            # No dnsx: drop names that don't resolve so httpx and later phases skip them
+            print(f"{Colors.BLUE}[*] Resolving {len(hosts)} subdomains in-process...{Colors.ENDC}")
+            resolved = await resolve_hosts(hosts)
+            with open(self.files["live_subdomains"], "w") as f:
+                f.write("".join(host + "\n" for host in resolved))
+            if resolved:
+                hosts = resolved
+
+        if "httpx" not in self.tool_paths and _HAVE_AIOHTTP and not self.dry_run:
+            # No httpx binary: probe in-process over the shared session (no tech/TLS data)
+            if target_list:
+                with open(target_list, "r") as f:
+                    hosts = [line.strip() for line in f if line.strip()]
+            await self._probe_live_native(hosts)
+            print(f"{Colors.GREEN}[+] Found {len(self.live_domains)} live web hosts.{Colors.ENDC}")
+            return
 
-        cmd = [
-            "httpx",
-            "-l", target_list,
+        cmd = ["httpx"]
+        if target_list:
+            cmd.extend(["-l", target_list])
+        cmd.extend([
             "-o", self.files["alive"],
             "-json",
             "-oJ", self.files["httpx_full"],
@@ -784,15 +973,16 @@ class ReconMaster:
             "-csp-probe",
             "-silent",
             "-threads", str(self.threads)
-        ]
-        await self._run_command(cmd, timeout=600)
+        ])
+        await self._run_command(cmd, timeout=600,
+                                input_data=None if target_list else "".join(h + "\n" for h in hosts))
 
         certificates = []
         if os.path.exists(self.files["httpx_full"]):
-            with open(self.files["httpx_full"], "r") as f:
+            with open(self.files["httpx_full"], "rb") as f:
                 for line in f:
                     try:
-                        entry = json.loads(line)
+                        entry = _json_loads(line)
                         url = entry.get("url")
                         if url:
                             self.live_domains.add(url)
@@ -809,15 +999,39 @@ class ReconMaster:
                         continue
 
         if certificates:
-            with open(self.files["certificates"], "w") as f:
-                json.dump(certificates, f, indent=4)
+            with open(self.files["certificates"], "wb") as f:
+                f.write(_json_dumps(certificates))
         
         if self.tech_stack:
-            with open(self.files["technologies"], "w") as f:
-                json.dump(self.tech_stack, f, indent=4)
+            with open(self.files["technologies"], "wb") as f:
+                f.write(_json_dumps(self.tech_stack))
 
         print(f"{Colors.GREEN}[+] Found {len(self.live_domains)} live web hosts.{Colors.ENDC}")
 
+    async def _probe_live_native(self, hosts: List[str]):
+        """Find live web hosts with aiohttp HEAD probes, https first then http"""
+        if not hosts:
+            return
+
+        logger.info("httpx not available, probing %d hosts in-process", len(hosts))
+        # Bounded by the shared connector's scan-wide limit
+        session = await self._get_session()
+
+        async def probe(host):
+            for scheme in ("https", "http"):
+                url = f"{scheme}://{host}"
+                try:
+                    async with session.head(url, allow_redirects=True, timeout=10):
+                        return url
+                except Exception:
+                    continue
+            return None
+
+        live = [url for url in await asyncio.gather(*(probe(h) for h in hosts)) if url]
+        self.live_domains.update(live)
+        with open(self.files["alive"], "w") as f:
+            f.write("".join(url + "\n" for url in sorted(self.live_domains)))
+
     async def scan_vulnerabilities(self, severity: Optional[str] = None):
         """Run nuclei for vulnerability detection with tech-profiling"""
         if not self.live_domains:
@@ -868,10 +1082,10 @@ class ReconMaster:
         if os.path.exists(self.files["nuclei_results"]):
             severities = {"critical": [], "high": [], "medium": [], "low": [], "info": []}
             try:
-                with open(self.files["nuclei_results"], "r") as f:
+                with open(self.files["nuclei_results"], "rb") as f:
                     for line in f:
                         if line.strip():
-                            v = json.loads(line)
+                            v = _json_loads(line)
                             self.vulns.append(v)
                             sev = v.get("info", {}).get("severity", "info").lower()
                             if sev in severities:
@@ -966,12 +1180,11 @@ class ReconMaster:
                 print(f"{Colors.YELLOW}[!] Found {len(broken)} broken social/external links!{Colors.ENDC}")
                 self._ensure_dir(self.files["broken_links"])
                 with open(self.files["broken_links"], "w") as f:
-                    for link in broken:
-                        f.write(link + "\n")
-                        self.vulns.append({
-                            "info": {"name": "Broken Social Link Hijack", "severity": "medium"},
-                            "matched-at": link
-                        })
+                    f.write("".join(link + "\n" for link in broken))
+                self.vulns.extend({
+                    "info": {"name": "Broken Social Link Hijack", "severity": "medium"},
+                    "matched-at": link
+                } for link in broken)
 
     async def take_screenshots(self):
         """Capture screenshots of live hosts chunk by chunk"""
@@ -989,8 +1202,7 @@ class ReconMaster:
                 temp_list = os.path.join(self.dirs["base"], f"temp_screenshot_list_{index}.txt")
                 try:
                     with open(temp_list, "w") as f:
-                        for url in chunk:
-                            f.write(url + "\n")
+                        f.write("".join(url + "\n" for url in chunk))
 
                     cmd = ["gowitness", "file", "-f", temp_list, "-P", screenshots_dir, "--no-http", "--timeout", "15"]
                     await self._run_command(cmd, timeout=300)
@@ -1027,33 +1239,34 @@ class ReconMaster:
         await self._run_command(cmd, timeout=1200)
 
         if os.path.exists(self.files["all_urls"]):
-            admin_panels = []
-            with open(self.files["all_urls"], "r") as f:
-                for line in f:
-                    url = line.strip()
-                    if not url:
-                        continue
-                    self.urls.add(url)
-                    
-                    # Identify JS files
-                    if ".js" in url.lower().split("?")[0]:
-                        self.js_files.add(url)
-                    
-                    # Identify admin panels
-                    admin_keywords = ["admin", "login", "wp-admin", "dashboard", "control", "panel", "auth"]
-                    if any(kw in url.lower() for kw in admin_keywords) and not url.endswith((".js", ".css", ".png", ".jpg")):
-                        admin_panels.append(url)
+            admin_panels = set()
+            # One binary read; splitlines/strip run in C and only non-empty lines get decoded
+            with open(self.files["all_urls"], "rb") as f:
+                data = f.read()
+            for raw in data.splitlines():
+                raw = raw.strip()
+                if not raw:
+                    continue
+                url = raw.decode("utf-8", "replace")
+                self.urls.add(url)
+                lowered = url.lower()
+
+                # Identify JS files
+                if ".js" in lowered.split("?", 1)[0]:
+                    self.js_files.add(url)
+
+                # Identify admin panels
+                if any(kw in lowered for kw in self.ADMIN_KEYWORDS) and not url.endswith((".js", ".css", ".png", ".jpg")):
+                    admin_panels.add(url)
 
             if admin_panels:
                 with open(self.files["admin_panels"], "w") as f:
-                    for panel in sorted(set(admin_panels)):
-                        f.write(panel + "\n")
+                    f.write("".join(panel + "\n" for panel in sorted(admin_panels)))
 
         # Save JS files separately
         if self.js_files:
             with open(self.files["javascript_files"], "w") as f:
-                for js in sorted(self.js_files):
-                    f.write(js + "\n")
+                f.write("".join(js + "\n" for js in sorted(self.js_files)))
 
         print(f"{Colors.GREEN}[+] Crawling finished. Extracted {len(self.urls)} URLs and {len(self.js_files)} JS files.{Colors.ENDC}")
 
@@ -1072,97 +1285,85 @@ class ReconMaster:
         if len(self.js_files) > max_js:
             logger.warning(f"JS analysis truncated to first {max_js} files")
 
-        regex_list = {
-            "google_api": r"AIza[0-9A-Za-z-_]{35}",
-            "amazon_aws_key": r"AKIA[0-9A-Z]{16}",
-            "github_access_token": r"[a-zA-Z0-9_-]*:[a-zA-Z0-9_\-]+@github\.com",
-            "slack_token": r"xox[baprs]-[0-9a-zA-Z]{10,48}",
-            "mailgun_api_key": r"key-[0-9a-zA-Z]{32}",
-            "stripe_api_key": r"sk_live_[0-9a-zA-Z]{24}",
-            "endpoint": r"(?:https?://|/)[a-zA-Z0-9.\-_/]+(?:\?[a-zA-Z0-9.\-_=&]+)?"
-        }
-
         # Optimized aiohttp configuration
         headers = {"User-Agent": random.choice(self.user_agents)}
-        connector = aiohttp.TCPConnector(ssl=False, limit=self.threads)
-        async with aiohttp.ClientSession(timeout=HTTP_TIMEOUT, connector=connector, headers=headers) as session:
-            
-            async def scan_js(js_url):
-                if not await self.circuit_breaker.check_can_proceed():
-                    logger.warning(f"Circuit breaker OPEN/COOLDOWN - skipping JS request: {js_url}")
-                    return js_url, []
+        session = await self._get_session()
 
-                try:
-                    async with session.get(js_url, timeout=15) as resp:
-                        if resp.status in [403, 429, 503]:
-                            await self.circuit_breaker.record_error(resp.status)
+        async def scan_js(js_url):
+            if not await self.circuit_breaker.check_can_proceed():
+                logger.warning("Circuit breaker OPEN/COOLDOWN - skipping JS request: %s", js_url)
+                return js_url, []
+
+            try:
+                async with session.get(js_url, timeout=15, headers=headers) as resp:
+                    if resp.status in _THROTTLE_STATUSES:
+                        await self.circuit_breaker.record_error(resp.status)
+                        return js_url, []
+
+                    if resp.status == 200:
+                        await self.circuit_breaker.record_success()
+
+                        # MEMORY OPTIMIZATION & PROTECTION
+                        content_length = resp.headers.get('Content-Length')
+                        if content_length and int(content_length) > self.MAX_FILE_SIZE_MB * 1024 * 1024:
+                            logger.warning("Skipping large JS file (%s bytes): %s", content_length, js_url)
                             return js_url, []
-                        
-                        if resp.status == 200:
-                            await self.circuit_breaker.record_success()
-                            
-                            # MEMORY OPTIMIZATION & PROTECTION
-                            content_length = resp.headers.get('Content-Length')
-                            if content_length and int(content_length) > self.MAX_FILE_SIZE_MB * 1024 * 1024:
-                                logger.warning(f"Skipping large JS file ({content_length} bytes): {js_url}")
-                                return js_url, []
-                                
-                            content = await resp.text()
-                            if len(content) > self.MAX_FILE_SIZE_MB * 1024 * 1024:
-                                logger.warning(f"Truncating massive JS response: {js_url}")
-                                content = content[:self.MAX_FILE_SIZE_MB * 1024 * 1024]
-
-                            findings = []
-                            for name, pattern in regex_list.items():
-                                matches = re.findall(pattern, content)
+
+                        content = await resp.text()
+                        if len(content) > self.MAX_FILE_SIZE_MB * 1024 * 1024:
+                            logger.warning("Truncating massive JS response: %s", js_url)
+                            content = content[:self.MAX_FILE_SIZE_MB * 1024 * 1024]
+
+                        findings = []
+                        for name, pattern in _JS_PATTERNS.items():
+                            matches = pattern.findall(content)
+                            if matches:
+                                matches = list(set(matches))
+                                if name == "endpoint":
+                                    # Better endpoint filtering: avoid single chars/slashes
+                                    matches = [m for m in matches 
+                                               if len(m) > 5 
+                                               and ("." in m or (m.count("/") > 1))
+                                               and m not in ["/", "//"]]
+                                    # Scope check for discovered endpoints
+                                    matches = [m for m in matches if self._is_url_in_scope(m)]
                                 if matches:
-                                    matches = list(set(matches))
-                                    if name == "endpoint":
-                                        # Better endpoint filtering: avoid single chars/slashes
-                                        matches = [m for m in matches 
-                                                   if len(m) > 5 
-                                                   and ("." in m or (m.count("/") > 1))
-                                                   and m not in ["/", "//"]]
-                                        # Scope check for discovered endpoints
-                                        matches = [m for m in matches if self._is_url_in_scope(m)]
-                                    if matches:
-                                        findings.append((name, matches))
-                            
-                            # Save per-file analysis with security
-                            safe_name = re.sub(r'[^a-zA-Z0-9]', '_', js_url.split('/')[-1])[:50]
-                            analysis_path = self._safe_path("js_analysis", f"{safe_name}_analysis.json")
-                            with open(analysis_path, "w") as f:
-                                json.dump({"url": js_url, "findings": findings}, f, indent=4)
-                                
-                            return js_url, findings
-                except Exception as e:
-                    logger.debug(f"JS scan failed for {js_url}: {e}")
-                    return js_url, []
-                return js_url, []
+                                    findings.append((name, matches))
 
-            # Process in parallel with limit
-            js_tasks = [scan_js(url) for url in list(self.js_files)[:max_js]]
-            results = await asyncio.gather(*js_tasks)
+                        # Save per-file analysis with security
+                        analysis_path = self._safe_path("js_analysis", f"{_js_analysis_name(js_url)}_analysis.json")
+                        with open(analysis_path, "w") as f:
+                            json.dump({"url": js_url, "findings": findings}, f, indent=4)
 
-            all_secrets = []
-            all_endpoints = []
-            
-            with open(self.files["js_secrets"], "w") as secret_f, open(self.files["js_endpoints"], "w") as end_f:
-                for url, findings in results:
-                    for name, matches in findings:
-                        if name == "endpoint":
-                            for m in matches:
-                                end_f.write(f"{m} (from {url})\n")
-                        else:
-                            for m in matches:
-                                secret_f.write(f"[{name}] {m} (from {url})\n")
-                                all_secrets.append(m)
-
-            if all_secrets:
-                os.makedirs(os.path.dirname(self.files["exposed_secrets"]), exist_ok=True)
-                with open(self.files["exposed_secrets"], "a") as f:
-                    for s in all_secrets:
-                        f.write(f"[JS Secret] {s}\n")
+                        return js_url, findings
+            except Exception as e:
+                logger.debug("JS scan failed for %s: %s", js_url, e)
+                return js_url, []
+            return js_url, []
+
+        # Process in parallel with limit
+        js_tasks = [scan_js(url) for url in list(self.js_files)[:max_js]]
+        results = await asyncio.gather(*js_tasks)
+
+        all_secrets = []
+        all_endpoints = []
+
+        with open(self.files["js_secrets"], "w") as secret_f, open(self.files["js_endpoints"], "w") as end_f:
+            for url, findings in results:
+                for name, matches in findings:
+                    if name == "endpoint":
+                        for m in matches:
+                            end_f.write(f"{m} (from {url})\n")
+                    else:
+                        for m in matches:
+                            secret_f.write(f"[{name}] {m} (from {url})\n")
+                            all_secrets.append(m)
+
+        if all_secrets:
+            os.makedirs(os.path.dirname(self.files["exposed_secrets"]), exist_ok=True)
+            with open(self.files["exposed_secrets"], "a") as f:
+                for s in all_secrets:
+                    f.write(f"[JS Secret] {s}\n")
 
     def _is_url_in_scope(self, url: str) -> bool:
         """Check if a full URL or path is within target scope"""
@@ -1175,8 +1376,8 @@ class ReconMaster:
         """Load historical scan state for regression analysis"""
         if os.path.exists(self.state_file):
             try:
-                with open(self.state_file, "r") as f:
-                    self.previous_state = json.load(f)
+                with open(self.state_file, "rb") as f:
+                    self.previous_state = _json_loads(f.read())
             except Exception:
                 self.previous_state = {}
         else:
@@ -1189,8 +1390,7 @@ class ReconMaster:
             "vulns": [v.get("template-id") for v in self.vulns],
             "timestamp": datetime.now().isoformat()
         }
-        with open(self.state_file, "w") as f:
-            json.dump(state, f, indent=2)
+        _write_json_atomic(self.state_file, state)
 
         # Also log key events
         log_file = self.files["scan_log"]
@@ -1240,57 +1440,67 @@ class ReconMaster:
 
         sensitive_paths = [".env", ".git/config", ".vscode/settings.json", "config.php.bak", "web.config", "robots.txt", "sitemap.xml", ".htaccess"]
         
-        # Load from Pro wordlists if available
+        # Load from Pro wordlists if available (set for O(1) dedup, list keeps order)
+        seen_paths = set(sensitive_paths)
         for wl in [self.quickhits_wordlist, self.common_wordlist]:
+            if len(sensitive_paths) >= self.MAX_SENSITIVE_PATHS:
+                break
             if os.path.exists(wl):
                 try:
                     with open(wl, "r") as f:
                         for line in f:
                             p = line.strip()
-                            if p and p not in sensitive_paths:
+                            if p and p not in seen_paths:
+                                seen_paths.add(p)
                                 sensitive_paths.append(p)
+                                if len(sensitive_paths) >= self.MAX_SENSITIVE_PATHS:
+                                    break
                 except Exception as e:
                     logger.warning(f"Failed to load wordlist {wl}: {e}")
 
-        # Deduplicate and limit for safety
-        sensitive_paths = list(dict.fromkeys(sensitive_paths))[:self.MAX_SENSITIVE_PATHS]
+        # Limit for safety
+        sensitive_paths = sensitive_paths[:self.MAX_SENSITIVE_PATHS]
         
         # Explicitly configure sessions and connectors
-        connector = aiohttp.TCPConnector(ssl=False, limit=10)
-        async with aiohttp.ClientSession(timeout=HTTP_TIMEOUT, connector=connector) as session:
+        session = await self._get_session()
 
-            async def check_path(base_url, path):
-                if not await self.circuit_breaker.check_can_proceed():
-                    return None
-                    
-                target = f"{base_url.rstrip('/')}/{path}"
-                try:
-                    async with session.get(target, timeout=5, allow_redirects=False) as resp:
-                        if resp.status in [403, 429, 503]:
-                            await self.circuit_breaker.record_error(resp.status)
-                        if resp.status == 200:
-                            await self.circuit_breaker.record_success()
-                            return target
-                except Exception:
-                    pass
+        async def check_path(base_url, path):
+            if not await self.circuit_breaker.check_can_proceed():
                 return None
 
-            tasks = []
-            for base_url in list(self.live_domains)[:20]:
-                for path in sensitive_paths:
-                    tasks.append(check_path(base_url, path))
-
-            found = await asyncio.gather(*tasks)
+            target = f"{base_url.rstrip('/')}/{path}"
+            try:
+                # Only the status matters: HEAD first, GET if the server rejects HEAD
+                async with session.head(target, timeout=5, allow_redirects=False) as resp:
+                    status = resp.status
+                if status == 405:
+                    async with session.get(target, timeout=5, allow_redirects=False) as resp:
+                        status = resp.status
+                if status in _THROTTLE_STATUSES:
+                    await self.circuit_breaker.record_error(status)
+                if status == 200:
+                    await self.circuit_breaker.record_success()
+                    return target
+            except Exception:
+                pass
+            return None
 
-            os.makedirs(os.path.dirname(self.files["exposed_secrets"]), exist_ok=True)
-            with open(self.files["exposed_secrets"], "a") as f:
-                for target in filter(None, found):
-                    print(f"{Colors.YELLOW}[!] Sensitive file exposed: {target}{Colors.ENDC}")
-                    f.write(f"[200] Sensitive File Exposed: {target}\n")
-                    self.vulns.append({
-                        "info": {"name": "Sensitive File Exposed", "severity": "medium"},
-                        "matched-at": target
-                    })
+        tasks = []
+        for base_url in self._host_sample(20):
+            for path in sensitive_paths:
+                tasks.append(check_path(base_url, path))
+
+        found = await asyncio.gather(*tasks)
+
+        os.makedirs(os.path.dirname(self.files["exposed_secrets"]), exist_ok=True)
+        with open(self.files["exposed_secrets"], "a") as f:
+            for target in filter(None, found):
+                print(f"{Colors.YELLOW}[!] Sensitive file exposed: {target}{Colors.ENDC}")
+                f.write(f"[200] Sensitive File Exposed: {target}\n")
+                self.vulns.append({
+                    "info": {"name": "Sensitive File Exposed", "severity": "medium"},
+                    "matched-at": target
+                })
 
     async def fuzz_api_endpoints(self):
         """Discover hidden API endpoints using specialized pro wordlist"""
@@ -1312,39 +1522,38 @@ class ReconMaster:
             logger.error(f"Error reading API wordlist: {e}")
             return
 
-        connector = aiohttp.TCPConnector(ssl=False, limit=self.threads)
-        async with aiohttp.ClientSession(timeout=HTTP_TIMEOUT, connector=connector) as session:
-            async def check_api(base_url, path):
-                if not await self.circuit_breaker.check_can_proceed():
-                    return None
-                    
-                target = f"{base_url.rstrip('/')}/{path.lstrip('/')}"
-                try:
-                    async with session.get(target, timeout=5) as resp:
-                        if resp.status in [403, 429, 503]:
-                            await self.circuit_breaker.record_error(resp.status)
-                            
-                        if resp.status in [200, 201, 401, 403]: # Interested in access or restricted
-                            if resp.status == 200:
-                                await self.circuit_breaker.record_success()
-                            return target, resp.status
-                except Exception:
-                    pass
+        session = await self._get_session()
+        async def check_api(base_url, path):
+            if not await self.circuit_breaker.check_can_proceed():
                 return None
 
-            tasks = []
-            for base_url in list(self.live_domains)[:10]: # Limit targets for performance
-                for path in api_paths[:50]: # First 50 for quick check
-                    tasks.append(check_api(base_url, path))
+            target = f"{base_url.rstrip('/')}/{path.lstrip('/')}"
+            try:
+                async with session.get(target, timeout=5) as resp:
+                    if resp.status in _THROTTLE_STATUSES:
+                        await self.circuit_breaker.record_error(resp.status)
 
-            found = await asyncio.gather(*tasks)
-            
-            with open(self.files["api_endpoints"], "w") as f:
-                for res in filter(None, found):
-                    target, status = res
-                    f.write(f"[{status}] {target}\n")
-                    if status == 200:
-                        print(f"{Colors.CYAN}[+] Discovered API Endpoint: {target}{Colors.ENDC}")
+                    if resp.status in self.API_INTEREST_STATUSES:
+                        if resp.status == 200:
+                            await self.circuit_breaker.record_success()
+                        return target, resp.status
+            except Exception:
+                pass
+            return None
+
+        tasks = []
+        for base_url in self._host_sample(10): # Limit targets for performance
+            for path in api_paths[:50]: # First 50 for quick check
+                tasks.append(check_api(base_url, path))
+
+        found = await asyncio.gather(*tasks)
+
+        with open(self.files["api_endpoints"], "w") as f:
+            for res in filter(None, found):
+                target, status = res
+                f.write(f"[{status}] {target}\n")
+                if status == 200:
+                    print(f"{Colors.CYAN}[+] Discovered API Endpoint: {target}{Colors.ENDC}")
 
     async def find_parameters(self):
         """Passive parameter discovery"""
@@ -1356,19 +1565,42 @@ class ReconMaster:
         # Sample interesting URLs (max 10)
         candidates = [u for u in list(self.urls) if "?" in u or "=" in u or "api" in u.lower()][:10]
         if not candidates:
-            candidates = list(self.live_domains)[:5]
+            candidates = self._host_sample(5)
+
+        use_wordlist = os.path.exists(self.params_wordlist)
 
-        for url in candidates:
-            cmd = ["arjun", "-u", url, "--passive", "-oT", self.files["parameters"] + "_tmp", "--silent"]
-            if os.path.exists(self.params_wordlist):
+        arjun_opts = ["--passive"]
+
+        async def run_arjun(idx, url):
+            cache_file = self._cache_file("arjun", [url], self.params_wordlist if use_wordlist else None, arjun_opts)
+            cached = self._cache_load(cache_file)
+            if cached is not None:
+                return url, cached
+
+            # Each concurrent run needs its own output file
+            tmp_out = f"{self.files['parameters']}_tmp{idx}"
+            cmd = ["arjun", "-u", url, *arjun_opts, "-oT", tmp_out, "--silent"]
+            if use_wordlist:
                 cmd.extend(["-w", self.params_wordlist])
+            # Bounded by the scan-wide tool semaphore in _run_command
             await self._run_command(cmd, timeout=120)
 
-            if os.path.exists(self.files["parameters"] + "_tmp"):
-                with open(self.files["parameters"] + "_tmp", "r") as f_src, open(self.files["parameters"], "a") as f_dst:
+            if not os.path.exists(tmp_out):
+                return url, None
+            with open(tmp_out, "r") as f_src:
+                params = f_src.read()
+            os.remove(tmp_out)
+            self._cache_store(cache_file, params)
+            return url, params
+
+        results = await asyncio.gather(*(run_arjun(i, url) for i, url in enumerate(candidates)))
+
+        # Append in candidate order so the report layout matches the sequential runs
+        with open(self.files["parameters"], "a") as f_dst:
+            for url, params in results:
+                if params is not None:
                     f_dst.write(f"--- Params for {url} ---\n")
-                    f_dst.write(f_src.read() + "\n")
-                os.remove(self.files["parameters"] + "_tmp")
+                    f_dst.write(params + "\n")
 
     async def fuzz_directories(self):
         """Perform directory brute-forcing on live hosts using ffuf"""
@@ -1378,38 +1610,71 @@ class ReconMaster:
         print(f"{Colors.BLUE}[*] Brute-forcing directories with ffuf...{Colors.ENDC}")
         
         # Use first 5 live domains to avoid over-scanning in baseline
-        targets = list(self.live_domains)[:5]
-        
-        for url in targets:
-            url_safe = re.sub(r'[^a-zA-Z0-9]', '_', url)[:50]
-            out_file = os.path.join(self.dirs["endpoints"], f"fuzz_{url_safe}.json")
-            
-            cmd = [
-                "ffuf",
-                "-w", self.dir_wordlist,
-                "-u", f"{url.rstrip('/')}/FUZZ",
-                "-mc", "200,201,204,301,302,401,403",
-                "-o", out_file,
-                "-of", "json",
-                "-t", str(min(self.threads * 2, 50)),
-                "-silent"
-            ]
-            await self._run_command(cmd, timeout=600)
-            
-            if os.path.exists(out_file):
-                try:
-                    with open(out_file, "r") as f:
-                        data = json.load(f)
-                        results = data.get("results", [])
-                        for res in results:
-                            path = res.get("url")
-                            status = res.get("status")
-                            if path:
-                                self.urls.add(path)
-                                if status == 200:
-                                    print(f"{Colors.CYAN}[+] Discovered Path: {path} ({status}){Colors.ENDC}")
-                except Exception as e:
-                    logger.error(f"Error parsing ffuf directory results: {e}")
+        targets = self._host_sample(5)
+
+        cache_file = self._cache_file("ffuf", targets, self.dir_wordlist, self._ffuf_dir_options())
+        results = self._cache_load(cache_file)
+        if results is not None:
+            logger.info("Using cached ffuf results for %d hosts", len(targets))
+        else:
+            results = await self._ffuf_directories(targets)
+            if results is not None:
+                self._cache_store(cache_file, results)
+
+        for res in results or []:
+            path = res.get("url")
+            status = res.get("status")
+            if path:
+                self.urls.add(path)
+                if status == 200:
+                    print(f"{Colors.CYAN}[+] Discovered Path: {path} ({status}){Colors.ENDC}")
+
+    def _ffuf_dir_options(self) -> List[str]:
+        """ffuf flags that shape the directory results, shared by the command line and its cache key"""
+        options = ["-mc", self.FFUF_DIR_MATCH_CODES]
+        # Pace requests inside ffuf, where they are actually sent
+        if self.rate_limit:
+            options.extend(["-rate", str(self.rate_limit)])
+        return options
+
+    async def _ffuf_directories(self, targets: List[str]) -> Optional[List[Dict[str, Any]]]:
+        """Run the batched ffuf directory scan and return its url/status results (None on failure)"""
+        # One ffuf run over HOST x FUZZ instead of one process (and wordlist load) per host
+        hosts_file = os.path.join(self.dirs["endpoints"], "fuzz_hosts.txt")
+        out_file = os.path.join(self.dirs["endpoints"], "fuzz_directories.json")
+        with open(hosts_file, "w") as f:
+            f.write("".join(url.rstrip("/") + "\n" for url in targets))
+
+        cmd = [
+            "ffuf",
+            "-w", f"{hosts_file}:HOST",
+            "-w", f"{self.dir_wordlist}:FUZZ",
+            "-u", "HOST/FUZZ",
+            *self._ffuf_dir_options(),
+            "-o", out_file,
+            "-of", "json",
+            "-t", str(min(self.threads * 2, 50)),
+            "-s"
+        ]
+        try:
+            await self._run_command(cmd, timeout=600 * len(targets))
+        finally:
+            if os.path.exists(hosts_file):
+                os.remove(hosts_file)
+
+        if not os.path.exists(out_file):
+            return None
+        try:
+            with open(out_file, "rb") as f:
+                if _HAVE_IJSON:
+                    # Only url/status are kept, so never hold ffuf's full per-result records in memory
+                    items = ijson.items(f, "results.item")
+                else:
+                    items = _json_loads(f.read()).get("results", [])
+                return [{"url": res.get("url"), "status": res.get("status")} for res in items]
+        except Exception as e:
+            logger.error(f"Error parsing ffuf directory results: {e}")
+            return None
 
     async def subjs_discovery(self):
         """Find JavaScript files from list of URLs using subjs"""
@@ -1421,8 +1686,7 @@ class ReconMaster:
         # Write live domains to a temp file for subjs
         temp_input = os.path.join(self.output_dir, "subjs_input.tmp")
         with open(temp_input, "w") as f:
-            for d in self.live_domains:
-                f.write(d + "\n")
+            f.write("".join(d + "\n" for d in self.live_domains))
         
         cmd = ["subjs", "-i", temp_input]
         stdout, stderr, rc = await self._run_command(cmd, timeout=300)
@@ -1451,16 +1715,36 @@ class ReconMaster:
             host = url.replace("https://", "").replace("http://", "").split("/")[0].split(":")[0]
             hosts.add(host)
 
-        top_hosts = list(hosts)[:5]  # Limit to top 5 for speed in general recon
+        # Limit to top 5 for speed in general recon; sorted so reruns (and monitor diffs) scan the same hosts
+        top_hosts = sorted(hosts)[:5]
+
+        # One output file per host (monitor's diff reads them by name), scanned concurrently.
+        # Capped one below the tool semaphore so arjun, which runs alongside, always keeps a slot
+        # (with a single thread they simply share it)
+        sem = asyncio.Semaphore(max(1, min(len(top_hosts), self.threads - 1)))
+        # Same packet-rate ceiling the ffuf runs get from scan.rate_limit
+        rate_args = ["--max-rate", str(self.rate_limit)] if self.rate_limit else []
 
-        for host in top_hosts:
+        async def scan_host(host):
             host_safe = host.replace(".", "_")
             out_file = os.path.join(self.dirs["nmap"], f"{host_safe}.txt")
-            cmd = ["nmap", "--top-ports", "1000", "-T4", "--open", host, "-oN", out_file]
-            await self._run_command(cmd, timeout=300)
+            cmd = ["nmap", "--top-ports", "1000", "-T4", "--open", *rate_args, host, "-oN", out_file]
+            async with sem:
+                return await self._run_command(cmd, timeout=300)
+
+        await asyncio.gather(*(scan_host(h) for h in top_hosts))
 
         print(f"{Colors.GREEN}[+] Port scan complete.{Colors.ENDC}")
 
+    def _severity_counts(self) -> Dict[str, int]:
+        """Count findings per severity in a single pass over self.vulns"""
+        counts = {"critical": 0, "high": 0, "medium": 0, "low": 0, "info": 0}
+        for v in self.vulns:
+            sev = (v.get("info") or {}).get("severity")
+            if sev in counts:
+                counts[sev] += 1
+        return counts
+
     def _calculate_risk_score(self) -> int:
         """Calculate a weighted risk score (0-100) using priority scores if available"""
         score = 0
@@ -1515,17 +1799,15 @@ class ReconMaster:
         base_profile = profiles.get(severity.lower(), profiles["info"])
         return f"[{plugin}] {base_profile}"
 
-    def _generate_premium_html_report(self, duration, end_dt):
+    def _generate_premium_html_report(self, duration, end_dt, severity_counts: Optional[Dict[str, int]] = None,
+                                      risk_score: Optional[int] = None):
         """Generate high-fidelity premium HTML report with interactive visualizations"""
         
         # Prepare data for charts
-        severity_counts = {
-            "critical": len([v for v in self.vulns if v.get("info", {}).get("severity") == "critical"]),
-            "high": len([v for v in self.vulns if v.get("info", {}).get("severity") == "high"]),
-            "medium": len([v for v in self.vulns if v.get("info", {}).get("severity") == "medium"]),
-            "low": len([v for v in self.vulns if v.get("info", {}).get("severity") == "low"]),
-            "info": len([v for v in self.vulns if v.get("info", {}).get("severity") == "info"]),
-        }
+        if severity_counts is None:
+            severity_counts = self._severity_counts()
+        if risk_score is None:
+            risk_score = self._calculate_risk_score()
 
         # Calculate technology distribution
         tech_dist = {}
@@ -1536,13 +1818,19 @@ class ReconMaster:
                     tech_dist[t_str] = tech_dist.get(t_str, 0) + 1
         top_techs = dict(sorted(tech_dist.items(), key=lambda x: x[1], reverse=True)[:10])
 
+        # Finding, URL and tech strings come from scanned hosts and tool output; escape them
+        # so the report can't be broken (or scripted) by attacker-controlled markup
+        esc = lambda value: html.escape(str(value))
+        # Chart labels land inside <script>: emit them as JSON with '</' neutralised
+        tech_labels = json.dumps(list(top_techs)).replace("</", "<\\/")
+
         html_template = f"""
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Titan Dashboard 2.0 - {self.target}</title>
+    <title>Titan Dashboard 2.0 - {esc(self.target)}</title>
     <link href="https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;600;700&family=JetBrains+Mono&display=swap" rel="stylesheet">
     <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
     <style>
@@ -1705,7 +1993,7 @@ class ReconMaster:
             <a href="#ai-insights">AI Intelligence</a>
         </nav>
         <div style="margin-top: auto; font-size: 0.75rem; color: var(--text-dim);">
-            Target: {self.target}<br>
+            Target: {esc(self.target)}<br>
             v4.0.0-Titan • Platinum Edition
         </div>
     </sidebar>
@@ -1713,14 +2001,14 @@ class ReconMaster:
     <main>
         <div class="header animate">
             <p>ADVANCED OFFENSIVE SECURITY ASSESSMENT</p>
-            <h1>{self.target}</h1>
+            <h1>{esc(self.target)}</h1>
             <p>Duration: {duration} | Assessment Date: {end_dt.strftime("%Y-%m-%d %H:%M:%S")}</p>
         </div>
 
         <div class="stats-grid animate" style="animation-delay: 0.1s">
             <div class="stat-card">
                 <div class="label">Overall Risk Score</div>
-                <div class="value">{self._calculate_risk_score()}/100</div>
+                <div class="value">{risk_score}/100</div>
             </div>
             <div class="stat-card">
                 <div class="label">Total Subdomains</div>
@@ -1754,19 +2042,19 @@ class ReconMaster:
                     <div style="width: 100%;">
                         <div style="display: flex; justify-content: space-between; align-items: flex-start;">
                             <div>
-                                <span class="severity-pill bg-{v.get('info', {}).get('severity', 'info').lower() if v.get('info') else 'info'}">{v.get('info', {}).get('severity', 'info') if v.get('info') else 'INFO'}</span>
-                                <strong style="margin-left: 10px; font-size: 1.1rem;">{v.get('info', {}).get('name', 'Discovery') if v.get('info') else 'Discovery'}</strong>
-                                <span style="margin-left: 10px; opacity: 0.5; font-size: 0.8rem;">[via {v.get('plugin', 'Core')}]</span>
+                                <span class="severity-pill bg-{esc(v.get('info', {}).get('severity', 'info').lower()) if v.get('info') else 'info'}">{esc(v.get('info', {}).get('severity', 'info')) if v.get('info') else 'INFO'}</span>
+                                <strong style="margin-left: 10px; font-size: 1.1rem;">{esc(v.get('info', {}).get('name', 'Discovery')) if v.get('info') else 'Discovery'}</strong>
+                                <span style="margin-left: 10px; opacity: 0.5; font-size: 0.8rem;">[via {esc(v.get('plugin', 'Core'))}]</span>
                             </div>
                             <div style="font-family: 'JetBrains Mono', monospace; color: var(--accent); font-weight: 700;">
                                 {f"Score: {v.get('info', {}).get('priority_score', 'N/A')}" if v.get('info', {}).get('priority_score') else ""}
                             </div>
                         </div>
                         <div style="color: var(--text-dim); margin-top: 10px; font-size: 0.95rem;">
-                            <code style="background: rgba(0,0,0,0.3); padding: 4px 8px; border-radius: 6px; border: 1px solid rgba(255,255,255,0.1); display: inline-block; width: 100%; word-break: break-all;">{v.get('matched-at', 'N/A')}</code>
+                            <code style="background: rgba(0,0,0,0.3); padding: 4px 8px; border-radius: 6px; border: 1px solid rgba(255,255,255,0.1); display: inline-block; width: 100%; word-break: break-all;">{esc(v.get('matched-at', 'N/A'))}</code>
                         </div>
                         <div style="margin-top: 12px; font-size: 0.85rem; line-height: 1.5; color: #cbd5e1; padding: 12px; background: rgba(0,0,0,0.2); border-radius: 8px;">
-                            <strong>Remediation:</strong> {v.get('info', {}).get('description', 'Review and apply security patches.')}
+                            <strong>Remediation:</strong> {esc(v.get('info', {}).get('description', 'Review and apply security patches.'))}
                         </div>
                     </div>
                 </div>
@@ -1779,10 +2067,10 @@ class ReconMaster:
             <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 1.5rem;">
                 {"".join([f'''
                 <div class="stat-card" style="border-left: 4px solid var(--accent);">
-                    <div style="font-weight: 700; margin-bottom: 12px; font-size: 1.1rem; color: var(--accent);">Intelligence: {v.get('info', {}).get('name') if v.get('info') else 'Finding'}</div>
-                    <div style="color: var(--text-dim); font-size: 0.95rem; line-height: 1.6;">{self._generate_ai_profile(v)}</div>
+                    <div style="font-weight: 700; margin-bottom: 12px; font-size: 1.1rem; color: var(--accent);">Intelligence: {esc(v.get('info', {}).get('name')) if v.get('info') else 'Finding'}</div>
+                    <div style="color: var(--text-dim); font-size: 0.95rem; line-height: 1.6;">{esc(self._generate_ai_profile(v))}</div>
                     <div style="margin-top: 15px; font-size: 0.8rem; opacity: 0.6; display: flex; align-items: center; gap: 5px;">
-                        <span>🔗</span> {v.get('matched-at')}
+                        <span>🔗</span> {esc(v.get('matched-at'))}
                     </div>
                 </div>
                 ''' for v in self.vulns[:6]]) if self.vulns else "<p>Insufficient data for intelligence profiling.</p>"}
@@ -1795,9 +2083,9 @@ class ReconMaster:
                 {"".join([f'''
                 <div class="finding-item">
                     <div style="width: 100%;">
-                        <div style="font-weight: 600; margin-bottom: 10px; overflow-wrap: break-word;">{url}</div>
+                        <div style="font-weight: 600; margin-bottom: 10px; overflow-wrap: break-word;">{esc(url)}</div>
                         <div style="display: flex; flex-wrap: wrap;">
-                            { "".join([f'<span class="tech-tag">{t}</span>' for t in t_list]) }
+                            { "".join([f'<span class="tech-tag">{esc(t)}</span>' for t in t_list]) }
                         </div>
                     </div>
                 </div>
@@ -1835,7 +2123,7 @@ class ReconMaster:
         new Chart(techCtx, {{
             type: 'bar',
             data: {{
-                labels: {list(top_techs.keys())},
+                labels: {tech_labels},
                 datasets: [{{
                     label: 'Adoption Count',
                     data: {list(top_techs.values())},
@@ -1937,6 +2225,10 @@ class ReconMaster:
         end_dt = datetime.now()
         duration = str(end_dt - start_dt)
 
+        # Shared by the JSON, Markdown and HTML outputs below
+        severity_counts = self._severity_counts()
+        risk_score = self._calculate_risk_score()
+
         summary_data = {
             "scan_info": {
                 "target": self.target,
@@ -1953,75 +2245,75 @@ class ReconMaster:
                 "js_files_analyzed": len(self.js_files),
                 "plugin_activity": getattr(self, 'plugin_summary', [])
             },
-            "findings": {
-                "critical": len([v for v in self.vulns if v.get("info", {}).get("severity") == "critical"]),
-                "high": len([v for v in self.vulns if v.get("info", {}).get("severity") == "high"]),
-                "medium": len([v for v in self.vulns if v.get("info", {}).get("severity") == "medium"]),
-                "low": len([v for v in self.vulns if v.get("info", {}).get("severity") == "low"]),
-                "info": len([v for v in self.vulns if v.get("info", {}).get("severity") == "info"])
-            }
+            "findings": severity_counts
         }
         os.makedirs(os.path.dirname(self.files["summary"]), exist_ok=True)
-        with open(self.files["summary"], "w", encoding="utf-8") as f:
-            json.dump(summary_data, f, indent=4)
+        _write_json_atomic(self.files["summary"], summary_data)
 
         # 📝 executive_report.md
+        # Assemble the Markdown in memory and hand it to the OS in one write
+        buf = io.StringIO()
+        write = buf.write
+        write(f"# Reconnaissance Executive Report: {self.target}\n\n")
+        write(f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        write(f"**Scope:** {len(self.subdomains)} Subdomains | {len(self.live_domains)} Live Hosts\n\n")
+        write(f"**Overall Risk Score:** {risk_score}/100\n\n")
+
+        write("## 🛡️ Vulnerabilities & Findings\n")
+        if not self.vulns and not self.takeovers:
+            write("No critical vulnerabilities discovered.\n\n")
+        else:
+            if self.takeovers:
+                write("### 🚨 Subdomain Takeovers\n")
+                for t in self.takeovers:
+                    write(f"- {t}\n")
+                write("\n")
+
+            if self.vulns:
+                write("### ⚠️ Key Findings\n")
+                for v in self.vulns[:20]:
+                    info = v.get('info', {}) or {}
+                    severity = str(info.get('severity', 'UNKNOWN')).upper()
+                    name = info.get('name', 'Unknown Finding')
+                    matched = v.get('matched-at', 'N/A')
+                    write(f"- **[{severity}]** {name} -> {matched}\n")
+
+        write("\n## 🧠 AI Threat Analysis\n\n")
+        if self.vulns:
+            for v in self.vulns[:5]:
+                analysis = self._generate_ai_profile(v)
+                write(f"### {v.get('info', {}).get('name')}\n")
+                write(f"- **AI Profile**: {analysis}\n")
+                write(f"- **Target**: {v.get('matched-at')}\n\n")
+
+        if self.new_findings.get("subdomains"):
+            write("## 🧬 Regression Analysis (New Findings)\n\n")
+            for sub in self.new_findings["subdomains"]:
+                write(f"- 🆕 [New Host] {sub}\n")
+            write("\n")
+
+        write("\n## 🌐 Infrastructure & Tech Stack\n")
+        for url, techs in list(self.tech_stack.items())[:10]:
+            write(f"- **{url}**: {', '.join(techs)}\n")
+
+        write(f"- Full Reports: `{os.path.abspath(self.output_dir)}`\n")
+        # Passive-only runs never write all_subdomains.txt; their merged list is all_passive.txt
+        subs_name = "all_subdomains.txt" if os.path.exists(self.files["all_subdomains"]) else "all_passive.txt"
+        write(f"- Subdomains: `./subdomains/{subs_name}`\n")
+        write(f"- Screenshots: `./screenshots/`\n")
+        write(f"- Endpoints: `./endpoints/all_urls.txt`\n\n")
+
+        if hasattr(self, 'plugin_summary') and self.plugin_summary:
+            write("## 🔌 Plugin Execution Summary\n")
+            for p in self.plugin_summary:
+                write(f"- **{p['name']}** (v{p['version']}): {p['status']}\n")
+
         self._ensure_dir(self.files["executive_report"])
         with open(self.files["executive_report"], "w", encoding="utf-8") as f:
-            f.write(f"# Reconnaissance Executive Report: {self.target}\n\n")
-            f.write(f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"**Scope:** {len(self.subdomains)} Subdomains | {len(self.live_domains)} Live Hosts\n\n")
-            f.write(f"**Overall Risk Score:** {self._calculate_risk_score()}/100\n\n")
-
-            f.write("## 🛡️ Vulnerabilities & Findings\n")
-            if not self.vulns and not self.takeovers:
-                f.write("No critical vulnerabilities discovered.\n\n")
-            else:
-                if self.takeovers:
-                    f.write("### 🚨 Subdomain Takeovers\n")
-                    for t in self.takeovers:
-                        f.write(f"- {t}\n")
-                    f.write("\n")
-
-                if self.vulns:
-                    f.write("### ⚠️ Key Findings\n")
-                    for v in self.vulns[:20]:
-                        info = v.get('info', {}) or {}
-                        severity = str(info.get('severity', 'UNKNOWN')).upper()
-                        name = info.get('name', 'Unknown Finding')
-                        matched = v.get('matched-at', 'N/A')
-                        f.write(f"- **[{severity}]** {name} -> {matched}\n")
-
-            f.write("\n## 🧠 AI Threat Analysis\n\n")
-            if self.vulns:
-                for v in self.vulns[:5]:
-                    analysis = self._generate_ai_profile(v)
-                    f.write(f"### {v.get('info', {}).get('name')}\n")
-                    f.write(f"- **AI Profile**: {analysis}\n")
-                    f.write(f"- **Target**: {v.get('matched-at')}\n\n")
-
-            if self.new_findings.get("subdomains"):
-                f.write("## 🧬 Regression Analysis (New Findings)\n\n")
-                for sub in self.new_findings["subdomains"]:
-                    f.write(f"- 🆕 [New Host] {sub}\n")
-                f.write("\n")
-
-            f.write("\n## 🌐 Infrastructure & Tech Stack\n")
-            for url, techs in list(self.tech_stack.items())[:10]:
-                f.write(f"- **{url}**: {', '.join(techs)}\n")
-
-            f.write(f"- Full Reports: `{os.path.abspath(self.output_dir)}`\n")
-            f.write(f"- Subdomains: `./subdomains/all_subdomains.txt`\n")
-            f.write(f"- Screenshots: `./screenshots/`\n")
-            f.write(f"- Endpoints: `./endpoints/all_urls.txt`\n\n")
-
-            if hasattr(self, 'plugin_summary') and self.plugin_summary:
-                f.write("## 🔌 Plugin Execution Summary\n")
-                for p in self.plugin_summary:
-                    f.write(f"- **{p['name']}** (v{p['version']}): {p['status']}\n")
+            f.write(buf.getvalue())
 
         # 🌐 full_report.html (Premium Interactive Dashboard)
-        html_content = self._generate_premium_html_report(duration, end_dt)
+        html_content = self._generate_premium_html_report(duration, end_dt, severity_counts, risk_score)
         with open(self.files["full_report"], "w", encoding="utf-8") as f:
             f.write(html_content)
 
@@ -2037,8 +2329,7 @@ class ReconMaster:
     def export_burp_targets(self):
         """Export URLs for Burp Suite Site Map import"""
         with open(self.files["burp_sitemap"], "w", encoding="utf-8") as f:
-            for url in sorted(self.urls):
-                f.write(url + "\n")
+            f.write("".join(url + "\n" for url in sorted(self.urls)))
 
     def export_burp_issues(self):
         """Export findings in a format suitable for Burp Issue Importer (with redaction)"""
@@ -2067,8 +2358,7 @@ class ReconMaster:
         context_out = self.files["zap_context"]
 
         with open(out, "w", encoding="utf-8") as f:
-            for url in self.urls:
-                f.write(url + "\n")
+            f.write("".join(url + "\n" for url in self.urls))
 
         # Simple ZAP Context
         context_xml = f"""<?xml version="1.0" encoding="UTF-8" standalone="no"?>
@@ -2087,59 +2377,61 @@ class ReconMaster:
 
 async def run_recon(recon, args):
     """Orchestrate the recon process"""
-    start_time = time.time()
-
-    # Discovery Phase
-    await recon._send_notification(f"🚀 Starting recon on {recon.target}", "info")
-    await recon.passive_subdomain_enum()
-
-    if not args.passive_only:
-        await recon.active_subdomain_enum()
-
-    await recon._send_notification(f"🔍 Discovery finished. Found {len(recon.subdomains)} subdomains.", "info")
-
-    # Analysis Phase
-    await recon.resolve_live_hosts()
-
-    if not args.passive_only and not recon.daily:
-        # Full scan phase (can run some tasks concurrently)
-        await asyncio.gather(
-            recon.scan_vulnerabilities(severity=getattr(args, 'nuclei_severity', None)),
-            recon.take_screenshots(),
-            recon.crawl_and_extract(),
-            recon.subjs_discovery(),
-            recon.fuzz_directories(),
-            recon.discover_sensitive_files(),
-            recon.fuzz_api_endpoints(),
-            recon.check_takeovers(),
-            recon.check_broken_links()
-        )
+    start_time = time.monotonic()
 
-        # Sequence dependent tasks
-        await recon.find_parameters()
-        await recon.port_scan()
-        await recon.load_and_run_plugins()
-
-    elif recon.daily:
-        # Specialized light-weight automation mode
-        await asyncio.gather(
-            recon.scan_vulnerabilities(severity=getattr(args, 'nuclei_severity', None)),
-            recon.fuzz_api_endpoints(),
-            recon.check_takeovers()
-        )
-        # Daily diff MUST run after discovery and vulnerability scan
-        recon.handle_daily_diff()
-    else:
-        # Minimal analysis for passive-only
-        await recon.take_screenshots()
+    try:
+        # Discovery Phase
+        await recon._send_notification(f"🚀 Starting recon on {recon.target}", "info")
+        await recon.passive_subdomain_enum()
+
+        if not args.passive_only:
+            await recon.active_subdomain_enum()
+
+        await recon._send_notification(f"🔍 Discovery finished. Found {len(recon.subdomains)} subdomains.", "info")
+
+        # Analysis Phase
+        await recon.resolve_live_hosts()
+
+        if not args.passive_only and not recon.daily:
+            # Full scan phase (can run some tasks concurrently)
+            await asyncio.gather(
+                recon.scan_vulnerabilities(severity=getattr(args, 'nuclei_severity', None)),
+                recon.take_screenshots(),
+                recon.crawl_and_extract(),
+                recon.subjs_discovery(),
+                recon.fuzz_directories(),
+                recon.discover_sensitive_files(),
+                recon.fuzz_api_endpoints(),
+                recon.check_takeovers(),
+                recon.check_broken_links()
+            )
+
+            # Sequence dependent tasks; parameter discovery and port scanning are independent of each other
+            await asyncio.gather(recon.find_parameters(), recon.port_scan())
+            await recon.load_and_run_plugins()
+
+        elif recon.daily:
+            # Specialized light-weight automation mode
+            await asyncio.gather(
+                recon.scan_vulnerabilities(severity=getattr(args, 'nuclei_severity', None)),
+                recon.fuzz_api_endpoints(),
+                recon.check_takeovers()
+            )
+            # Daily diff MUST run after discovery and vulnerability scan
+            recon.handle_daily_diff()
+        else:
+            # Minimal analysis for passive-only
+            await recon.take_screenshots()
 
-    # Post-processing and state management
-    recon._save_state()
-    recon.generate_report()
+        # Post-processing and state management
+        recon._save_state()
+        recon.generate_report()
 
-    await recon._send_notification(f"✅ Recon complete for {recon.target}. Risk Score: {recon._calculate_risk_score()}/100", "success")
+        await recon._send_notification(f"✅ Recon complete for {recon.target}. Risk Score: {recon._calculate_risk_score()}/100", "success")
+    finally:
+        await recon.close()
 
-    duration = time.time() - start_time
+    duration = time.monotonic() - start_time
     print(f"\n{Colors.BOLD}{Colors.GREEN}[PRO] ReconMaster finished in {duration:.2f}s.{Colors.ENDC}")
 
 
@@ -2166,6 +2458,7 @@ def main():
     parser.add_argument("--include", help="Comma-separated list of domains/patterns to include")
     parser.add_argument("--exclude", help="Comma-separated list of domains/patterns to exclude")
     parser.add_argument("--resume", action="store_true", help="Resume from existing artifacts")
+    parser.add_argument("--cache", action="store_true", help="Reuse ffuf/arjun results from runs in the last 24h on the same targets")
     parser.add_argument("--daily", action="store_true", help="Enable daily automation mode (light recon + diff)")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose debug logging")
     parser.add_argument("--scan-id", help="Deterministic scan identifier for output directory")
@@ -2251,10 +2544,13 @@ def main():
             recon.exclude_list = [x.strip() for x in args.exclude.split(",")]
 
         recon.resume = args.resume
+        recon.use_cache = args.cache
         recon.daily = args.daily
         recon.dry_run = getattr(args, 'dry_run', False)
         recon.webhook_url = args.webhook
 
+        if _HAVE_UVLOOP:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
         asyncio.run(run_recon(recon, args))
 
     except KeyboardInterrupt:
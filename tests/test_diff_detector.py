@@ -0,0 +1,194 @@
+import json
+import random
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from monitor import diff_detector
+from monitor.diff_detector import DiffDetector
+
+
+def _reference_subdomains(scan_dir: Path):
+    """Subdomain loading as DiffDetector did it before the sidecar cache and regex parsing"""
+    subdomains = set()
+    live_file = scan_dir / "subdomains" / "live_subdomains.txt"
+    if live_file.exists():
+        with open(live_file, "r") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    subdomains.add(line.split("://")[1].split("/")[0] if "://" in line else line)
+    passive_file = scan_dir / "subdomains" / "all_passive.txt"
+    if passive_file.exists():
+        with open(passive_file, "r") as f:
+            subdomains.update(line.strip() for line in f if line.strip())
+    return subdomains
+
+
+def _reference_ports(scan_dir: Path):
+    """nmap parsing as DiffDetector did it before the regex/mmap reader"""
+    port_summary = {}
+    for nmap_file in (scan_dir / "nmap").glob("*.txt"):
+        open_ports = []
+        with open(nmap_file, "r") as f:
+            for line in f:
+                if "/tcp" in line and "open" in line:
+                    try:
+                        open_ports.append(int(line.split("/")[0].strip()))
+                    except ValueError:
+                        continue
+        if open_ports:
+            port_summary[nmap_file.stem] = open_ports
+    return port_summary
+
+
+def _nmap_output(ports):
+    lines = ["Nmap scan report for example.com", "PORT     STATE SERVICE"]
+    lines += [f"{p}/tcp  open  svc" for p in ports]
+    return "\n".join(lines) + "\n"
+
+
+class TestSetDelta(unittest.TestCase):
+    def _check(self, prev, curr):
+        added, removed = DiffDetector._set_delta(prev, curr)
+        self.assertEqual(set(added), curr - prev)
+        self.assertEqual(set(removed), prev - curr)
+
+    def test_matches_directional_differences(self):
+        rng = random.Random(1)
+        for _ in range(200):
+            prev = {f"h{rng.randrange(60)}" for _ in range(rng.randrange(40))}
+            curr = {f"h{rng.randrange(60)}" for _ in range(rng.randrange(40))}
+            self._check(prev, curr)
+
+    def test_empty_sides(self):
+        self._check(set(), set())
+        self._check(set(), {"a", "b"})
+        self._check({"a", "b"}, set())
+        self._check({"a"}, {"a"})
+
+    def test_two_phase_path_matches_symmetric_difference(self):
+        rng = random.Random(2)
+        with patch.object(DiffDetector, "TWO_PHASE_THRESHOLD", 5):
+            for _ in range(100):
+                prev = {f"h{rng.randrange(80)}" for _ in range(rng.randrange(10, 50))}
+                curr = {f"h{rng.randrange(80)}" for _ in range(rng.randrange(10, 50))}
+                self._check(prev, curr)
+                self.assertEqual(DiffDetector._two_phase_difference(prev, curr), (curr - prev, prev - curr))
+
+
+class TestDiffPorts(unittest.TestCase):
+    CASES = [
+        ([80, 443], [80, 443]),
+        ([80], [80, 443, 8080]),
+        ([22, 80, 443, 8443], [443]),
+        ([21, 22], [3306, 5432]),
+        ([80, 80, 443], [443, 443]),
+    ]
+
+    def _check_all(self):
+        for prev, curr in self.CASES:
+            new, closed = DiffDetector._diff_ports(prev, curr)
+            self.assertEqual(set(new), set(curr) - set(prev))
+            self.assertEqual(set(closed), set(prev) - set(curr))
+
+    def test_set_fallback(self):
+        with patch.object(diff_detector, "_HAVE_ROARING", False):
+            self._check_all()
+
+    @unittest.skipUnless(diff_detector._HAVE_ROARING, "pyroaring not installed")
+    def test_roaring_bitmaps(self):
+        self._check_all()
+
+
+class TestDetectChanges(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.prev = self.root / "prev"
+        self.curr = self.root / "curr"
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _write_scan(self, scan_dir, live, passive, takeovers, ports):
+        (scan_dir / "subdomains").mkdir(parents=True)
+        (scan_dir / "nmap").mkdir()
+        (scan_dir / "subdomains" / "live_subdomains.txt").write_text("\n".join(live) + "\n")
+        (scan_dir / "subdomains" / "all_passive.txt").write_text("\n".join(passive) + "\n\n")
+        (scan_dir / "subdomains" / "takeovers.txt").write_text("# header\n" + "\n".join(takeovers) + "\n")
+        for host, host_ports in ports.items():
+            (scan_dir / "nmap" / f"{host}.txt").write_text(_nmap_output(host_ports))
+
+    def _build(self):
+        self._write_scan(
+            self.prev,
+            live=["https://a.example.com/", "b.example.com", "http://old.example.com:8080/x"],
+            passive=["a.example.com", "b.example.com", "old.example.com"],
+            takeovers=["[cname] gone.example.com"],
+            ports={"a_example_com": [80, 443], "b_example_com": [22]},
+        )
+        self._write_scan(
+            self.curr,
+            live=["https://a.example.com/", "http://new.example.com/login"],
+            passive=["a.example.com", "new.example.com", "c.example.com"],
+            takeovers=["[cname] fresh.example.com"],
+            ports={"a_example_com": [443, 8443], "b_example_com": [22], "c_example_com": [80]},
+        )
+
+    def _by_type(self, changes):
+        return {c["type"]: c["details"] for c in changes}
+
+    def test_matches_reference_loaders(self):
+        self._build()
+        changes = self._by_type(DiffDetector().detect_changes(str(self.prev), str(self.curr), {}))
+
+        prev_subs, curr_subs = _reference_subdomains(self.prev), _reference_subdomains(self.curr)
+        self.assertEqual(set(changes["new_subdomains"]), curr_subs - prev_subs)
+        self.assertEqual(set(changes["removed_subdomains"]), prev_subs - curr_subs)
+        self.assertEqual(changes["new_takeover_vulnerability"], ["[cname] fresh.example.com"])
+        self.assertEqual(changes["resolved_takeover"], ["[cname] gone.example.com"])
+
+        prev_ports, curr_ports = _reference_ports(self.prev), _reference_ports(self.curr)
+        self.assertEqual(DiffDetector()._load_port_summary(self.curr), curr_ports)
+        self.assertEqual(changes["new_open_ports"]["host"], "a_example_com")
+        self.assertEqual(set(changes["new_open_ports"]["ports"]),
+                         set(curr_ports["a_example_com"]) - set(prev_ports["a_example_com"]))
+        self.assertEqual(set(changes["closed_ports"]["ports"]),
+                         set(prev_ports["a_example_com"]) - set(curr_ports["a_example_com"]))
+
+    def test_identical_scans_report_nothing(self):
+        self._build()
+        self.assertEqual(DiffDetector().detect_changes(str(self.prev), str(self.prev), {}), [])
+
+    def test_sidecar_cache_reused_and_invalidated(self):
+        self._build()
+        DiffDetector().detect_changes(str(self.prev), str(self.curr), {})
+        cache_file = self.curr / DiffDetector.CACHE_FILE
+        self.assertTrue(cache_file.exists())
+        cached = json.loads(cache_file.read_text())
+        self.assertEqual(set(cached["subdomains"]["data"]), _reference_subdomains(self.curr))
+
+        # Unchanged artifacts: a fresh detector answers from the sidecar without parsing
+        with patch.object(DiffDetector, "_parse_subdomains", side_effect=AssertionError("re-parsed")):
+            self.assertEqual(DiffDetector()._load_subdomains(self.curr), _reference_subdomains(self.curr))
+
+        # Changed artifact: the fingerprint no longer matches, so the file is parsed again
+        with open(self.curr / "subdomains" / "all_passive.txt", "a") as f:
+            f.write("added.example.com\n")
+        loaded = DiffDetector()._load_subdomains(self.curr)
+        self.assertIn("added.example.com", loaded)
+        self.assertEqual(loaded, _reference_subdomains(self.curr))
+
+    def test_cache_survives_missing_artifacts(self):
+        (self.curr / "subdomains").mkdir(parents=True)
+        detector = DiffDetector()
+        self.assertEqual(detector._load_subdomains(self.curr), set())
+        self.assertEqual(detector._load_port_summary(self.curr), {})
+        detector._flush_caches(self.curr)
+        self.assertEqual(DiffDetector()._load_subdomains(self.curr), set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+
+from reconmaster.report_templates import generate_premium_html_report
+
+
+class TestPremiumHtmlReport(unittest.TestCase):
+    def _render(self, **overrides):
+        recon = SimpleNamespace(target="example.com", vulns=[], tech_stack={})
+        for key, value in overrides.items():
+            setattr(recon, key, value)
+        return generate_premium_html_report(recon, "0:01:00", datetime(2024, 1, 1))
+
+    def test_escapes_finding_fields(self):
+        page = self._render(vulns=[{
+            "info": {"name": "<script>alert(1)</script>", "severity": 'high" onmouseover="x'},
+            "matched-at": "https://a.example.com/?q=<img src=x onerror=alert(1)>",
+            "plugin": "<b>Plugin</b>",
+        }])
+
+        self.assertNotIn("<script>alert(1)", page)
+        self.assertIn("&lt;script&gt;alert(1)&lt;/script&gt;", page)
+        self.assertNotIn("<img src=x", page)
+        self.assertNotIn('" onmouseover="x', page)
+        self.assertIn("bg-high&quot; onmouseover=&quot;x", page)
+        self.assertNotIn("<b>Plugin</b>", page)
+
+    def test_escapes_target(self):
+        page = self._render(target="<svg onload=alert(1)>.example.com")
+        self.assertNotIn("<svg", page)
+        self.assertIn("&lt;svg onload=alert(1)&gt;.example.com", page)
+
+    def test_chart_labels_cannot_close_script(self):
+        page = self._render(tech_stack={"a.example.com": ["</script><script>alert(1)</script>", "nginx"]})
+        script = page[page.index("const techCtx"):]
+        self.assertEqual(script.count("</script>"), 1)
+        self.assertIn('"<\\/script><script>alert(1)<\\/script>"', script)
+        self.assertIn('"nginx"', script)
+
+
+if __name__ == "__main__":
+    unittest.main()
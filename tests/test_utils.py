@@ -0,0 +1,87 @@
+import asyncio
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from reconmaster.utils import async_run, merge_and_dedupe_text_files
+
+
+class TestMergeAndDedupe(unittest.TestCase):
+    def setUp(self):
+        self.input_dir = tempfile.mkdtemp()
+        self.output_file = os.path.join(self.input_dir, "merged", "all_passive.out")
+
+    def tearDown(self):
+        shutil.rmtree(self.input_dir, ignore_errors=True)
+
+    def _write(self, name, text):
+        with open(os.path.join(self.input_dir, name), "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def _read_output(self):
+        with open(self.output_file, "r", encoding="utf-8") as f:
+            return f.read()
+
+    def test_merges_sorted_unique_lines(self):
+        self._write("subfinder.txt", "b.example.com\na.example.com\n\n")
+        self._write("amass.txt", "  c.example.com  \nb.example.com\r\n")
+        self._write("assetfinder.txt", "a.example.com")
+        self._write("notes.json", "ignored.example.com\n")
+
+        merged = merge_and_dedupe_text_files(self.input_dir, "*.txt", self.output_file)
+
+        expected = ["a.example.com", "b.example.com", "c.example.com"]
+        self.assertEqual(merged, expected)
+        self.assertEqual(self._read_output(), "".join(line + "\n" for line in expected))
+
+    def test_matches_set_then_sort_on_random_input(self):
+        rng = random.Random(7)
+        seen = set()
+        for i in range(5):
+            lines = [f"{rng.choice('abcXYZ-.')}{rng.randrange(500)}.example.com" for _ in range(rng.randrange(300))]
+            lines += [""] * rng.randrange(3)
+            seen.update(lines)
+            self._write(f"tool{i}.txt", "\n".join(lines) + "\n")
+        seen.discard("")
+
+        merged = merge_and_dedupe_text_files(self.input_dir, "*.txt", self.output_file)
+
+        self.assertEqual(merged, sorted(seen))
+        self.assertEqual(self._read_output().splitlines(), sorted(seen))
+
+    def test_no_matching_inputs(self):
+        merged = merge_and_dedupe_text_files(self.input_dir, "*.txt", self.output_file)
+        self.assertEqual(merged, [])
+        self.assertTrue(os.path.exists(self.output_file))
+
+
+@unittest.skipIf(sys.platform == "win32", "uses sleep and POSIX process groups")
+class TestAsyncRun(unittest.IsolatedAsyncioTestCase):
+    async def test_returns_output(self):
+        out, err, rc = await async_run(["cat"], timeout=10, input_data="a.example.com\n")
+        self.assertEqual((out, rc), ("a.example.com\n", 0))
+
+    async def test_cancel_kills_child(self):
+        pids = []
+        spawn = asyncio.create_subprocess_exec
+
+        async def record(*args, **kwargs):
+            proc = await spawn(*args, **kwargs)
+            pids.append(proc.pid)
+            return proc
+
+        with patch("asyncio.create_subprocess_exec", side_effect=record):
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(async_run(["sleep", "37"], timeout=60), 0.5)
+
+        self.assertEqual(len(pids), 1)
+        with self.assertRaises(ProcessLookupError):
+            os.kill(pids[0], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()